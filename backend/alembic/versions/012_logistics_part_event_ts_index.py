@@ -0,0 +1,31 @@
+"""ordering index for per-part movement queries
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # logistics_entries is written on every transfer; build without blocking writes.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logistics_part_event_ts_id
+            ON logistics_entries (org_id, part_id, (COALESCE(sent_at, created_at)) DESC, id DESC)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_logistics_part_event_ts_id")
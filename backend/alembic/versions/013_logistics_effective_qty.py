@@ -0,0 +1,42 @@
+"""stored effective quantity on logistics entries, with its covering index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table; run in a maintenance window.
+    op.execute(
+        """
+        ALTER TABLE logistics_entries
+        ADD COLUMN IF NOT EXISTS effective_qty INTEGER
+        GENERATED ALWAYS AS (COALESCE(qty_received, qty_sent, quantity, 0)) STORED
+        """
+    )
+    # Covering index so per-stage quantity sums stay index-only; built without blocking writes.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logistics_part_stage_status_eqty
+            ON logistics_entries (org_id, part_id, stage_id, status)
+            INCLUDE (effective_qty, qty_sent, quantity, sent_at)
+            WHERE status IN ('sent', 'in_transit', 'received', 'completed')
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_logistics_part_stage_status_eqty")
+    op.execute("ALTER TABLE logistics_entries DROP COLUMN IF EXISTS effective_qty")
@@ -0,0 +1,31 @@
+"""partial index for the single-active-movement check
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logistics_part_active
+            ON logistics_entries (org_id, part_id)
+            WHERE status IN ('sent', 'in_transit') AND sent_at IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_logistics_part_active")
@@ -0,0 +1,37 @@
+"""add per-part composite indexes on stage facts
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_stage_facts_part_stage
+            ON stage_facts (part_id, stage)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_stage_facts_org_part_created
+            ON stage_facts (org_id, part_id, created_at DESC)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_stage_facts_org_part_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_stage_facts_part_stage")
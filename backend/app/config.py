@@ -16,10 +16,23 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 20
-    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_MAX_OVERFLOW: int = 40
+    # Recycle pooled connections before server-side idle timeouts can kill them mid-checkout.
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    # SQLAlchemy compiled-statement cache (per engine). Tenant-scoped queries bind org_id as a
+    # parameter, so one cache entry serves every organization.
+    DATABASE_QUERY_CACHE_SIZE: int = 1200
+    # Test/CI only: make part reads raise on any relationship they did not eager-load.
+    SQL_RAISELOAD: bool = False
+    # Sync endpoints and the get_db dependency run on AnyIO's worker threads. Keep that pool no
+    # larger than the DB pool (POOL_SIZE + MAX_OVERFLOW) so threads never queue on connections
+    # while requests that already hold one wait for a thread to finish.
+    THREADPOOL_MAX_WORKERS: int = 40
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    # TTL for cached per-part movements/journey responses; 0 disables the cache.
+    PART_READ_CACHE_TTL_SECONDS: int = 30
 
     # Proxy / client IP handling
     # Only trust X-Forwarded-* headers when running behind a trusted reverse proxy (e.g. nginx).
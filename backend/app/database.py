@@ -1,18 +1,33 @@
 """Database configuration and session management."""
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
+
+def _json_serializer(value) -> str:
+    # orjson for JSON/JSONB columns (audit details, raw payloads); non-str keys are
+    # stringified like the stdlib encoder does.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
-# Create session factory
+# Create session factory. Sessions are per request (see get_db), not thread-scoped: sync
+# handlers share AnyIO worker threads, so a scoped_session would leak identity maps and
+# open transactions between requests. Statement compilation is already amortized across
+# requests by the engine-level query cache above.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
@@ -20,7 +35,11 @@ Base = declarative_base()
 
 
 def get_db():
-    """Dependency for getting database session."""
+    """Dependency for getting a request-scoped database session.
+
+    The session is always closed so its connection returns to the pool even when
+    the handler raises.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -1,5 +1,8 @@
 """FastAPI application."""
 
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,11 +11,23 @@ from .domain_errors import DomainError
 from .problem_details import build_problem_details_response
 from .routers import auth, users, parts, facts, tasks, uploads, telegram, machines, audit, specifications, directory, movements, inventory
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Handlers use the sync Session; bound worker threads by DB pool capacity (see config).
+    db_pool_capacity = settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    to_thread.current_default_thread_limiter().total_tokens = max(
+        1, min(settings.THREADPOOL_MAX_WORKERS, db_pool_capacity)
+    )
+    yield
+
+
 # Create app
 app = FastAPI(
     title="ERP/MES Production Control",
     version="1.0.0",
-    description="Backend API for ERP/MES Production Control System"
+    description="Backend API for ERP/MES Production Control System",
+    lifespan=lifespan,
 )
 
 # Production safety checks (fail closed on insecure cookie config).
@@ -1,7 +1,7 @@
 """SQLAlchemy models - FULL VERSION with all fixes for A/B/C/D requirements."""
 from sqlalchemy import (
     Boolean, Column, String, Integer, Date, DateTime, Text, 
-    ForeignKey, CheckConstraint, Index, UniqueConstraint, ARRAY
+    ForeignKey, CheckConstraint, Computed, Index, UniqueConstraint, ARRAY, and_
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -127,6 +127,8 @@ class Machine(Base):
             department.in_(['machining', 'fitting', 'galvanic', 'heat_treatment', 'grinding', 'qc', 'logistics']),
             name='chk_machine_department'
         ),
+        # Active-machine picker: org-scoped, name-ordered scan over active rows only.
+        Index('idx_machines_org_active_name', 'org_id', 'name', postgresql_where=(is_active == True)),
     )
     
     # Relationships
@@ -318,6 +320,8 @@ class PartStageStatus(Base):
 class StageFact(Base):
     """Stage fact model (production record)."""
     __tablename__ = "stage_facts"
+    # Fetch the server-side created_at via RETURNING at flush time.
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), index=True)
@@ -360,6 +364,10 @@ class StageFact(Base):
             name='chk_operator_for_machining'
         ),
         Index('idx_stage_facts_date_shift', 'date', 'shift_type'),
+        # Per-stage totals group a part's facts by stage.
+        Index('idx_stage_facts_part_stage', 'part_id', 'stage'),
+        # Latest fact for a part (journey last event): one backward index step.
+        Index('idx_stage_facts_org_part_created', 'org_id', 'part_id', created_at.desc()),
         # Unique constraint for machining only
         Index(
             'idx_stage_facts_unique_machining',
@@ -370,7 +378,8 @@ class StageFact(Base):
     )
     
     # Relationships
-    part = relationship("Part", back_populates="stage_facts")
+    # Load explicitly (e.g. joinedload) where needed; implicit per-fact lazy loads are an N+1 trap.
+    part = relationship("Part", back_populates="stage_facts", lazy="raise")
     attachments = relationship("StageFactAttachment", back_populates="stage_fact", cascade="all, delete-orphan")
 
 
@@ -633,6 +642,8 @@ class NotificationOutbox(Base):
 class LogisticsEntry(Base):
     """Logistics entry model."""
     __tablename__ = "logistics_entries"
+    # Fetch server-side timestamps and effective_qty via RETURNING at flush time.
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), index=True)
@@ -658,6 +669,11 @@ class LogisticsEntry(Base):
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
     qty_sent = Column(Integer, nullable=True)
     qty_received = Column(Integer, nullable=True)
+    # Quantity that counts towards totals once received; maintained by Postgres.
+    effective_qty = Column(
+        Integer,
+        Computed("COALESCE(qty_received, qty_sent, quantity, 0)", persisted=True),
+    )
     stage_id = Column(UUID(as_uuid=True), ForeignKey("part_stage_statuses.id"), nullable=True, index=True)
     last_tracking_status = Column(String(255), nullable=True)
     tracking_last_checked_at = Column(DateTime(timezone=True), nullable=True)
@@ -680,4 +696,23 @@ class LogisticsEntry(Base):
             ]),
             name='chk_logistics_status'
         ),
+        # Stage/cooperation quantity aggregates and the active-movement check read only these columns.
+        Index(
+            'idx_logistics_part_stage_status_eqty',
+            'org_id', 'part_id', 'stage_id', 'status',
+            postgresql_include=['effective_qty', 'qty_sent', 'quantity', 'sent_at'],
+            postgresql_where=status.in_(['sent', 'in_transit', 'received', 'completed']),
+        ),
+        # Single-active-movement check on create/update: only in-flight rows are indexed.
+        Index(
+            'idx_logistics_part_active',
+            'org_id', 'part_id',
+            postgresql_where=and_(status.in_(['sent', 'in_transit']), sent_at.isnot(None)),
+        ),
+        # Per-part movement lists and journey slot lookups order by the effective event time,
+        # with id as the journey's tie-break.
+        Index(
+            'idx_logistics_part_event_ts_id',
+            'org_id', 'part_id', func.coalesce(sent_at, created_at).desc(), id.desc(),
+        ),
     )
@@ -6,14 +6,16 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, selectinload
-from uuid import UUID
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, joinedload, selectinload
+from uuid import UUID, uuid4
 from ..database import get_db
 from ..models import User, Part, StageFact, StageFactAttachment, AuditEvent
 from ..schemas import StageFactCreate, StageFactUpdate, StageFactResponse, UserBrief, AttachmentBase
 from ..auth import get_current_user, PermissionChecker
 from ..config import settings
 from ..security import apply_part_visibility_scope, can_access_part, require_org_entity
+from ..services.part_read_cache import invalidate_part_read_cache
 from ..services.part_state import (
     STAGE_LABELS_RU,
     StageTotals,
@@ -21,11 +23,27 @@ from ..services.part_state import (
     recompute_part_state,
     stage_prerequisites,
     validate_stage_flow,
+    with_added_fact,
 )
 
 router = APIRouter(tags=["facts"])
 FACT_ENABLED_STAGES: set[str] = {"machining", "fitting", "qc"}
 
+# Stages whose facts must exist before a fact can be recorded for the key stage
+# (only those included in the part's required_stages are enforced).
+_FINISHING_STAGES: tuple[str, ...] = ("galvanic", "heat_treatment", "grinding")
+_COOP_FACT_PREREQUISITES: dict[str, tuple[str, ...]] = {
+    "qc": _FINISHING_STAGES,
+}
+_SHOP_FACT_PREREQUISITES: dict[str, tuple[str, ...]] = {
+    "fitting": ("machining",),
+    "galvanic": ("fitting",),
+    "heat_treatment": ("fitting",),
+    "grinding": ("fitting",),
+    # QC should go after fitting and all selected finishing stages.
+    "qc": ("fitting", *_FINISHING_STAGES),
+}
+
 _SAFE_FILENAME_RE = re.compile(
     r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\\.[A-Za-z0-9]{1,16}$"
 )
@@ -66,6 +84,28 @@ def _normalize_attachment_url(filename: str) -> str:
     return f"/api/v1/attachments/serve/{filename}"
 
 
+def _build_attachments(
+    fact_id: UUID,
+    attachments: list[AttachmentBase],
+    filenames: list[str],
+) -> list[StageFactAttachment]:
+    """Build attachment rows from validated payload items (fields read directly, no model_dump)."""
+    return [
+        StageFactAttachment(
+            stage_fact_id=fact_id,
+            name=att_data.name,
+            url=_normalize_attachment_url(filename),
+            type=att_data.type,
+            size=att_data.size,
+        )
+        for att_data, filename in zip(attachments, filenames)
+    ]
+
+
+def _attachment_key(attachment: StageFactAttachment) -> tuple:
+    return (attachment.url, attachment.name, attachment.type, attachment.size)
+
+
 def _assert_attachment_files_exist(*, filenames: list[str], current_user: User) -> None:
     base_dir = Path(settings.UPLOAD_DIR) / str(current_user.org_id)
     for name in filenames:
@@ -77,36 +117,18 @@ def _assert_attachment_files_exist(*, filenames: list[str], current_user: User)
 def _ensure_stage_prerequisites(db: Session, part: Part, stage: str) -> None:
     """Validate basic production flow dependencies for shop parts."""
     required_stages = set(part.required_stages or [])
-    required_for_stage: list[str] = []
-
-    if part.is_cooperation:
-        if stage == "qc":
-            required_for_stage = [
-                optional_stage
-                for optional_stage in ("galvanic", "heat_treatment", "grinding")
-                if optional_stage in required_stages
-            ]
-    else:
-        if stage == "fitting":
-            required_for_stage = ["machining"]
-        elif stage in {"galvanic", "heat_treatment", "grinding"}:
-            required_for_stage = ["fitting"]
-        elif stage == "qc":
-            # QC should go after fitting and all selected finishing stages.
-            required_for_stage = ["fitting"] + [
-                optional_stage
-                for optional_stage in ("galvanic", "heat_treatment", "grinding")
-                if optional_stage in required_stages
-            ]
+    prerequisites = _COOP_FACT_PREREQUISITES if part.is_cooperation else _SHOP_FACT_PREREQUISITES
+    required_for_stage = [
+        prerequisite_stage
+        for prerequisite_stage in prerequisites.get(stage, ())
+        if prerequisite_stage in required_stages
+    ]
 
     if not required_for_stage:
         return
 
     missing: list[str] = []
     for prerequisite_stage in required_for_stage:
-        if prerequisite_stage not in required_stages:
-            continue
-
         has_prerequisite_fact = db.query(StageFact.id).filter(
             StageFact.part_id == part.id,
             StageFact.stage == prerequisite_stage,
@@ -116,8 +138,9 @@ def _ensure_stage_prerequisites(db: Session, part: Part, stage: str) -> None:
             missing.append(prerequisite_stage)
 
     if missing:
-        current_label = STAGE_LABELS_RU.get(stage, stage)
-        missing_labels = ", ".join(STAGE_LABELS_RU.get(s, s) for s in missing)
+        labels = STAGE_LABELS_RU
+        current_label = labels.get(stage, stage)
+        missing_labels = ", ".join([labels.get(s, s) for s in missing])
         raise HTTPException(
             status_code=409,
             detail=(
@@ -252,11 +275,13 @@ def create_stage_fact(
 
     _ensure_stage_prerequisites(db, part, data.stage)
 
+    # Aggregate once; the post-insert flow check derives its totals from this snapshot.
+    totals_before = compute_stage_totals(db, part=part)
+
     # Enforce flow quantity constraints (for downstream stages).
     if data.stage != "machining":
         prereq = stage_prerequisites(part, data.stage)
         if prereq:
-            totals_before = compute_stage_totals(db, part=part)
             available = min(totals_before.get(s, StageTotals()).good for s in prereq)
             processed_before = totals_before.get(data.stage, StageTotals()).processed
             processed_after = processed_before + data.qty_good + data.qty_scrap
@@ -332,8 +357,20 @@ def create_stage_fact(
         data.shift_type = 'none'
         data.machine_id = None
     
-    # Create fact
+    # Validate attachments before building any rows.
+    filenames: list[str] = []
+    for att_data in data.attachments:
+        filename = _extract_attachment_filename(att_data.url)
+        if not filename:
+            raise HTTPException(status_code=400, detail="Invalid attachment url")
+        filenames.append(filename)
+    if filenames:
+        _assert_attachment_files_exist(filenames=filenames, current_user=current_user)
+
+    # Create fact. The id is assigned client-side so attachments can reference it and
+    # both go out in a single flush.
     fact = StageFact(
+        id=uuid4(),
         org_id=current_user.org_id,
         part_id=part_id,
         stage=data.stage,
@@ -348,29 +385,19 @@ def create_stage_fact(
         created_by_id=current_user.id
     )
     db.add(fact)
+    db.add_all(_build_attachments(fact.id, data.attachments, filenames))
+    # Sessions don't autoflush: the stage operator lookup in the recompute must see the new fact,
+    # and the stage timestamps need its server-side created_at.
     db.flush()
-    
-    # Add attachments
-    filenames: list[str] = []
-    for att_data in data.attachments:
-        filename = _extract_attachment_filename(att_data.url)
-        if not filename:
-            raise HTTPException(status_code=400, detail="Invalid attachment url")
-        filenames.append(filename)
-    if filenames:
-        _assert_attachment_files_exist(filenames=filenames, current_user=current_user)
-
-    for att_data, filename in zip(data.attachments, filenames):
-        attachment = StageFactAttachment(
-            stage_fact_id=fact.id,
-            name=att_data.name,
-            url=_normalize_attachment_url(filename),
-            type=att_data.type,
-            size=att_data.size,
-        )
-        db.add(attachment)
 
-    totals_after = compute_stage_totals(db, part=part)
+    totals_after = with_added_fact(
+        totals_before,
+        part=part,
+        stage=data.stage,
+        qty_good=data.qty_good,
+        qty_scrap=data.qty_scrap,
+        created_at=fact.created_at,
+    )
     violation = validate_stage_flow(part, totals_after)
     if violation:
         raise HTTPException(status_code=409, detail=violation)
@@ -397,7 +424,9 @@ def create_stage_fact(
     )
     db.add(audit)
     
+    org_id = part.org_id
     db.commit()
+    invalidate_part_read_cache(org_id, part_id)
     db.refresh(fact)
     
     # Build response
@@ -480,23 +509,24 @@ def update_stage_fact(
     db: Session = Depends(get_db)
 ):
     """Update existing stage fact."""
-    fact = db.query(StageFact).filter(
-        StageFact.id == fact_id,
-        StageFact.org_id == current_user.org_id
-    ).first()
+    fact = (
+        db.query(StageFact)
+        .options(joinedload(StageFact.part))
+        .filter(
+            StageFact.id == fact_id,
+            StageFact.org_id == current_user.org_id
+        )
+        .first()
+    )
 
     if not fact:
         raise HTTPException(status_code=404, detail="Факт не найден")
 
     _ensure_stage_supports_facts(fact.stage)
 
-    part = require_org_entity(
-        db,
-        Part,
-        entity_id=fact.part_id,
-        org_id=current_user.org_id,
-        not_found="Деталь не найдена",
-    )
+    part = fact.part
+    if not part or part.org_id != current_user.org_id:
+        raise HTTPException(status_code=404, detail="Деталь не найдена")
     if not can_access_part(db, part, current_user):
         raise HTTPException(status_code=403, detail="Access denied")
 
@@ -547,10 +577,7 @@ def update_stage_fact(
     fact.comment = data.comment
     fact.deviation_reason = data.deviation_reason
 
-    # Replace attachments
-    db.query(StageFactAttachment).filter(
-        StageFactAttachment.stage_fact_id == fact.id
-    ).delete(synchronize_session=False)
+    # Sync attachments: only rows that actually changed are deleted/inserted.
     filenames: list[str] = []
     for att_data in data.attachments:
         filename = _extract_attachment_filename(att_data.url)
@@ -560,15 +587,30 @@ def update_stage_fact(
     if filenames:
         _assert_attachment_files_exist(filenames=filenames, current_user=current_user)
 
-    for att_data, filename in zip(data.attachments, filenames):
-        attachment = StageFactAttachment(
-            stage_fact_id=fact.id,
-            name=att_data.name,
-            url=_normalize_attachment_url(filename),
-            type=att_data.type,
-            size=att_data.size,
-        )
-        db.add(attachment)
+    unmatched_existing: dict[tuple, list[StageFactAttachment]] = {}
+    for existing_attachment in fact.attachments:
+        unmatched_existing.setdefault(_attachment_key(existing_attachment), []).append(existing_attachment)
+
+    added_attachments: list[StageFactAttachment] = []
+    for attachment in _build_attachments(fact.id, data.attachments, filenames):
+        same_existing = unmatched_existing.get(_attachment_key(attachment))
+        if same_existing:
+            same_existing.pop()
+            continue
+        added_attachments.append(attachment)
+    db.add_all(added_attachments)
+
+    removed_attachment_ids = [
+        existing_attachment.id
+        for leftovers in unmatched_existing.values()
+        for existing_attachment in leftovers
+    ]
+    if removed_attachment_ids:
+        db.query(StageFactAttachment).filter(
+            StageFactAttachment.id.in_(removed_attachment_ids)
+        ).delete(synchronize_session=False)
+    # Sessions don't autoflush: push the edited quantities once so the totals below see them.
+    db.flush()
 
     totals_after = compute_stage_totals(db, part=part)
     violation = validate_stage_flow(part, totals_after)
@@ -598,7 +640,9 @@ def update_stage_fact(
     )
     db.add(audit)
 
+    org_id, part_id = part.org_id, part.id
     db.commit()
+    invalidate_part_read_cache(org_id, part_id)
     db.refresh(fact)
 
     operator = (
@@ -618,35 +662,38 @@ def delete_stage_fact(
     """Rollback (delete) a stage fact.
 
     Only high-privilege roles can delete facts. The deletion is audited.
+    The row is deleted and snapshotted in one DELETE ... RETURNING (attachments go via
+    ON DELETE CASCADE); later rejections leave the transaction uncommitted.
     """
-    fact = db.query(StageFact).filter(
-        StageFact.id == fact_id,
-        StageFact.org_id == current_user.org_id,
+    deleted = db.execute(
+        delete(StageFact)
+        .where(
+            StageFact.id == fact_id,
+            StageFact.org_id == current_user.org_id,
+        )
+        .returning(
+            StageFact.part_id,
+            StageFact.stage,
+            StageFact.shift_type,
+            StageFact.qty_good,
+            StageFact.qty_scrap,
+            StageFact.date,
+            StageFact.operator_id,
+        )
     ).first()
-    if not fact:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Факт не найден")
 
     part = require_org_entity(
         db,
         Part,
-        entity_id=fact.part_id,
+        entity_id=deleted.part_id,
         org_id=current_user.org_id,
         not_found="Деталь не найдена",
     )
     if not can_access_part(db, part, current_user):
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Snapshot for audit before delete.
-    deleted_stage = fact.stage
-    deleted_shift = fact.shift_type
-    deleted_qty_good = fact.qty_good
-    deleted_qty_scrap = fact.qty_scrap
-    deleted_date = fact.date
-    deleted_operator_id = fact.operator_id
-
-    db.delete(fact)
-    db.flush()
-
     totals_after = compute_stage_totals(db, part=part)
     violation = validate_stage_flow(part, totals_after)
     if violation:
@@ -668,15 +715,17 @@ def delete_stage_fact(
         part_code=part.code,
         details={
             "event": "fact_deleted",
-            "stage": deleted_stage,
-            "shift": deleted_shift,
-            "qtyGood": deleted_qty_good,
-            "qtyScrap": deleted_qty_scrap,
-            "date": str(deleted_date),
-            "operatorId": str(deleted_operator_id) if deleted_operator_id else None,
+            "stage": deleted.stage,
+            "shift": deleted.shift_type,
+            "qtyGood": deleted.qty_good,
+            "qtyScrap": deleted.qty_scrap,
+            "date": str(deleted.date),
+            "operatorId": str(deleted.operator_id) if deleted.operator_id else None,
         },
     )
     db.add(audit)
 
+    org_id, part_id = part.org_id, part.id
     db.commit()
+    invalidate_part_read_cache(org_id, part_id)
     return None
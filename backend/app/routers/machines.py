@@ -1,5 +1,6 @@
 """Machine endpoints."""
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -17,16 +18,22 @@ def list_machines(
     db: Session = Depends(get_db),
 ):
     """List active machines for current organization."""
-    machines = (
-        db.query(Machine)
-        .filter(
+    # Column tuples only: the response needs no ORM identity/state tracking.
+    rows = db.execute(
+        select(
+            Machine.id,
+            Machine.name,
+            Machine.department,
+            Machine.rate_per_shift,
+        )
+        .where(
             Machine.org_id == current_user.org_id,
-            Machine.is_active.is_(True),
+            # "= true" (not IS TRUE) so the planner can match the idx_machines_org_active_name predicate.
+            Machine.is_active == True,
         )
         .order_by(Machine.name)
-        .all()
-    )
-    return machines
+    ).all()
+    return [MachineResponse.model_validate(row._mapping) for row in rows]
 
 
 @router.get("/{machine_id}", response_model=MachineResponse)
@@ -36,15 +43,9 @@ def get_machine(
     db: Session = Depends(get_db),
 ):
     """Get single machine by ID."""
-    machine = (
-        db.query(Machine)
-        .filter(
-            Machine.id == machine_id,
-            Machine.org_id == current_user.org_id,
-        )
-        .first()
-    )
-    if not machine:
+    # Primary-key lookup is served from the identity map when already loaded; tenant is checked here.
+    machine = db.get(Machine, machine_id)
+    if not machine or machine.org_id != current_user.org_id:
         raise HTTPException(status_code=404, detail="Machine not found")
     return machine
 
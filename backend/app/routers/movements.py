@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, time, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import ValidationError
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, column, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import ProgrammingError
 
 from ..auth import PermissionChecker, get_current_user
@@ -17,9 +19,12 @@ from ..database import get_db
 from ..models import LogisticsEntry, Part, PartStageStatus, StageFact, User
 from ..schemas import JourneyEventOut, JourneyOut, MovementCreate, MovementOut, MovementUpdate
 from ..security import can_access_part, require_org_entity
-from ..services.part_state import compute_stage_totals, stage_prerequisites
+from ..services.movement_response_builder import MOVEMENT_OUT_COLUMNS, build_movement_out
+from ..services.part_read_cache import get_cached_part_read, invalidate_part_read_cache, store_part_read
+from ..services.part_state import cached_stage_totals, stage_prerequisites
 from ..services.movement_rules import (
-    ACTIVE_MOVEMENT_STATUSES,
+    ACTIVE_MOVEMENT_STATUS_VALUES,
+    RECEIVED_MOVEMENT_STATUS_VALUES,
     has_real_shipment_semantics,
     normalize_movement_status,
 )
@@ -29,7 +34,7 @@ from ..use_cases.movements_use_cases import (
     update_movement_use_case,
 )
 
-router = APIRouter(tags=["movements"])
+router = APIRouter(tags=["movements"], default_response_class=ORJSONResponse)
 
 STAGE_FLOW_ORDER = ("machining", "fitting", "heat_treatment", "galvanic", "grinding", "qc")
 STAGE_LABELS: dict[str, str] = {
@@ -49,12 +54,9 @@ MOVEMENT_STATUS_LABELS: dict[str, str] = {
     "cancelled": "отменено",
     "completed": "завершено",
 }
-RECEIVED_MOVEMENT_STATUSES: tuple[str, ...] = ("received", "completed")
-
-
-def _movement_qty_from_row(*, qty_received: int | None, qty_sent: int | None, quantity: int | None) -> int:
-    value = qty_received if qty_received is not None else qty_sent if qty_sent is not None else quantity
-    return int(value or 0)
+_MOVEMENT_LIST_ADAPTER = TypeAdapter(list[MovementOut])
+OPEN_STAGE_STATUSES: frozenset[str] = frozenset({"pending", "in_progress"})
+SHOP_LOCATION_ALIASES: frozenset[str] = frozenset({"производство", "цех", "production", "shop"})
 
 
 def _cooperation_received_qty(
@@ -64,22 +66,12 @@ def _cooperation_received_qty(
     exclude_movement_id: UUID | None = None,
 ) -> int:
     query = db.query(
-        func.coalesce(
-            func.sum(
-                func.coalesce(
-                    LogisticsEntry.qty_received,
-                    LogisticsEntry.qty_sent,
-                    LogisticsEntry.quantity,
-                    0,
-                )
-            ),
-            0,
-        )
+        func.coalesce(func.sum(LogisticsEntry.effective_qty), 0)
     ).filter(
         LogisticsEntry.org_id == part.org_id,
         LogisticsEntry.part_id == part.id,
         LogisticsEntry.stage_id.is_(None),
-        LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUSES),
+        LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUS_VALUES),
     )
     if exclude_movement_id is not None:
         query = query.filter(LogisticsEntry.id != exclude_movement_id)
@@ -105,7 +97,7 @@ def _is_cooperation_inbound(
         return True
 
     target = (to_holder or to_location or "").strip().lower()
-    return target in {"производство", "цех", "production", "shop"}
+    return target in SHOP_LOCATION_ALIASES
 
 
 def _ensure_cooperation_receive_limit(
@@ -126,12 +118,20 @@ def _ensure_cooperation_receive_limit(
             detail="Количество поступления должно быть больше 0",
         )
 
+    # Postgres rejects FOR UPDATE on an aggregate, so lock the part row instead: concurrent
+    # receives for the part queue here, and the sum below then sees every committed one.
+    qty_plan = (
+        db.query(Part.qty_plan)
+        .filter(Part.id == part.id, Part.org_id == part.org_id)
+        .with_for_update()
+        .scalar()
+    )
     already_received = _cooperation_received_qty(
         db=db,
         part=part,
         exclude_movement_id=exclude_movement_id,
     )
-    remaining = max(int(part.qty_plan or 0) - already_received, 0)
+    remaining = max(int(qty_plan or 0) - already_received, 0)
     if incoming_qty > remaining:
         raise HTTPException(
             status_code=409,
@@ -142,84 +142,65 @@ def _ensure_cooperation_receive_limit(
         )
 
 
-def _stage_allocated_qty(
+# SQL forms of the movement_rules predicates. Statuses are stored normalized (CHECK
+# constraint), so plain IN matches normalize_movement_status.
+_IS_ACTIVE_MOVEMENT = LogisticsEntry.status.in_(ACTIVE_MOVEMENT_STATUS_VALUES)
+_IS_ACTIVE_SENT_MOVEMENT = and_(_IS_ACTIVE_MOVEMENT, LogisticsEntry.sent_at.isnot(None))
+# has_real_shipment_semantics
+_AFFECTS_LOCATION = or_(
+    _IS_ACTIVE_SENT_MOVEMENT,
+    LogisticsEntry.status.in_(("received", "returned", "cancelled")),
+)
+_IS_JOURNEY_EVENT = and_(
+    LogisticsEntry.status != "pending",
+    ~and_(_IS_ACTIVE_MOVEMENT, LogisticsEntry.sent_at.is_(None)),
+)
+
+
+@dataclass(frozen=True)
+class _StageMovementQuantities:
+    allocated: int
+    cooperation_received: int
+
+
+def _stage_movement_quantities(
     *,
     db: Session,
-    org_id: UUID,
-    part_id: UUID,
+    part: Part,
     stage_id: UUID,
     exclude_movement_id: UUID | None = None,
-) -> int:
-    rows = (
-        db.query(
-            LogisticsEntry.status,
-            LogisticsEntry.sent_at,
-            LogisticsEntry.qty_sent,
-            LogisticsEntry.qty_received,
-            LogisticsEntry.quantity,
-        )
-        .filter(
-            LogisticsEntry.org_id == org_id,
-            LogisticsEntry.part_id == part_id,
-            LogisticsEntry.stage_id == stage_id,
-        )
-        .all()
-    )
+) -> _StageMovementQuantities:
+    """Quantity already routed to `stage_id` and the cooperation inbound total, in one scan."""
+    is_received = LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUS_VALUES)
+    on_stage = LogisticsEntry.stage_id == stage_id
+    if exclude_movement_id is not None:
+        on_stage = and_(on_stage, LogisticsEntry.id != exclude_movement_id)
 
-    allocated = 0
-    for status, sent_at, qty_sent, qty_received, quantity in rows:
-        normalized = normalize_movement_status(status)
-        if normalized in RECEIVED_MOVEMENT_STATUSES:
-            allocated += _movement_qty_from_row(
-                qty_received=qty_received,
-                qty_sent=qty_sent,
-                quantity=quantity,
-            )
-            continue
-        if normalized in ACTIVE_MOVEMENT_STATUSES and sent_at is not None:
-            allocated += _movement_qty_from_row(
-                qty_received=None,
-                qty_sent=qty_sent,
-                quantity=quantity,
-            )
-    if exclude_movement_id is None:
-        return allocated
-
-    current = (
-        db.query(
-            LogisticsEntry.status,
-            LogisticsEntry.sent_at,
-            LogisticsEntry.qty_sent,
-            LogisticsEntry.qty_received,
-            LogisticsEntry.quantity,
-        )
-        .filter(
-            LogisticsEntry.org_id == org_id,
-            LogisticsEntry.part_id == part_id,
-            LogisticsEntry.stage_id == stage_id,
-            LogisticsEntry.id == exclude_movement_id,
-        )
-        .first()
+    # Statuses are stored normalized (CHECK constraint), so SQL IN matches normalize_movement_status.
+    allocated_qty = case(
+        (and_(on_stage, is_received), LogisticsEntry.effective_qty),
+        (
+            and_(on_stage, _IS_ACTIVE_SENT_MOVEMENT),
+            func.coalesce(LogisticsEntry.qty_sent, LogisticsEntry.quantity, 0),
+        ),
+        else_=0,
+    )
+    cooperation_received_qty = case(
+        (and_(LogisticsEntry.stage_id.is_(None), is_received), LogisticsEntry.effective_qty),
+        else_=0,
+    )
+    row = db.query(
+        func.coalesce(func.sum(allocated_qty), 0).label("allocated"),
+        func.coalesce(func.sum(cooperation_received_qty), 0).label("cooperation_received"),
+    ).filter(
+        LogisticsEntry.org_id == part.org_id,
+        LogisticsEntry.part_id == part.id,
+        or_(LogisticsEntry.stage_id == stage_id, LogisticsEntry.stage_id.is_(None)),
+    ).one()
+    return _StageMovementQuantities(
+        allocated=int(row.allocated or 0),
+        cooperation_received=int(row.cooperation_received or 0),
     )
-    if not current:
-        return allocated
-
-    status, sent_at, qty_sent, qty_received, quantity = current
-    normalized = normalize_movement_status(status)
-    current_allocated = 0
-    if normalized in RECEIVED_MOVEMENT_STATUSES:
-        current_allocated = _movement_qty_from_row(
-            qty_received=qty_received,
-            qty_sent=qty_sent,
-            quantity=quantity,
-        )
-    elif normalized in ACTIVE_MOVEMENT_STATUSES and sent_at is not None:
-        current_allocated = _movement_qty_from_row(
-            qty_received=None,
-            qty_sent=qty_sent,
-            quantity=quantity,
-        )
-    return max(allocated - current_allocated, 0)
 
 
 def _stage_source_qty(
@@ -227,14 +208,15 @@ def _stage_source_qty(
     db: Session,
     part: Part,
     stage_status: PartStageStatus,
+    cooperation_received_qty: int,
 ) -> int:
     prerequisites = stage_prerequisites(part, stage_status.stage)
     if prerequisites:
-        totals = compute_stage_totals(db, part=part)
+        totals = cached_stage_totals(db, part=part)
         return min(int((totals.get(stage).good if totals.get(stage) else 0)) for stage in prerequisites)
 
     if part.is_cooperation and stage_status.stage in {"heat_treatment", "galvanic", "grinding"}:
-        return _cooperation_received_qty(db=db, part=part)
+        return cooperation_received_qty
 
     return int(part.qty_plan or 0)
 
@@ -250,15 +232,19 @@ def _ensure_stage_movement_allowed(
     if requested_qty <= 0:
         raise HTTPException(status_code=409, detail="Для этапа укажите количество больше 0")
 
-    source_qty = _stage_source_qty(db=db, part=part, stage_status=stage_status)
-    allocated_qty = _stage_allocated_qty(
+    quantities = _stage_movement_quantities(
         db=db,
-        org_id=part.org_id,
-        part_id=part.id,
+        part=part,
         stage_id=stage_status.id,
         exclude_movement_id=exclude_movement_id,
     )
-    remaining_qty = max(source_qty - allocated_qty, 0)
+    source_qty = _stage_source_qty(
+        db=db,
+        part=part,
+        stage_status=stage_status,
+        cooperation_received_qty=quantities.cooperation_received,
+    )
+    remaining_qty = max(source_qty - quantities.allocated, 0)
 
     if requested_qty > remaining_qty:
         stage_label = STAGE_LABELS.get(stage_status.stage, stage_status.stage)
@@ -275,102 +261,167 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _count_active_movements(
+def _has_active_movement(
     db: Session,
     *,
     org_id: UUID,
     part_id: UUID,
     exclude_movement_id: Optional[UUID] = None,
-) -> int:
-    active_statuses = tuple(ACTIVE_MOVEMENT_STATUSES)
-    query = db.query(LogisticsEntry).filter(
+) -> bool:
+    query = db.query(LogisticsEntry.id).filter(
         LogisticsEntry.org_id == org_id,
         LogisticsEntry.part_id == part_id,
-        and_(
-            LogisticsEntry.status.in_(active_statuses),
-            LogisticsEntry.sent_at.isnot(None),
-        ),
+        _IS_ACTIVE_SENT_MOVEMENT,
     )
     if exclude_movement_id:
         query = query.filter(LogisticsEntry.id != exclude_movement_id)
-    return query.count()
+    return bool(db.query(query.exists()).scalar())
 
 
-def _movement_event_timestamp(movement: LogisticsEntry | None) -> datetime | None:
-    if not movement:
-        return None
-    return (
-        movement.cancelled_at
-        or movement.returned_at
-        or movement.received_at
-        or movement.sent_at
-        or movement.updated_at
-        or movement.created_at
+# When a movement last changed state: the latest lifecycle timestamp that is set.
+_MOVEMENT_EVENT_TS = func.coalesce(
+    LogisticsEntry.cancelled_at,
+    LogisticsEntry.returned_at,
+    LogisticsEntry.received_at,
+    LogisticsEntry.sent_at,
+    LogisticsEntry.updated_at,
+    LogisticsEntry.created_at,
+)
+
+
+@dataclass(frozen=True)
+class _JourneyMovements:
+    last: LogisticsEntry | None = None
+    active: LogisticsEntry | None = None
+    location: LogisticsEntry | None = None
+    event: LogisticsEntry | None = None
+    event_ts: datetime | None = None
+    cooperation_received: int = 0
+
+
+def _load_journey_movements(
+    db: Session,
+    *,
+    org_id: UUID,
+    part_id: UUID,
+    with_cooperation_received: bool = False,
+) -> _JourneyMovements:
+    """Pick the newest movement for each journey slot in SQL; at most four rows are loaded."""
+    # The cooperation inbound total rides on the "last" row, so it costs no extra round trip
+    # and is naturally zero for a part without movements.
+    cooperation_received = literal(0)
+    if with_cooperation_received:
+        cooperation_received = (
+            select(func.coalesce(func.sum(LogisticsEntry.effective_qty), 0))
+            .where(
+                LogisticsEntry.org_id == org_id,
+                LogisticsEntry.part_id == part_id,
+                LogisticsEntry.stage_id.is_(None),
+                LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUS_VALUES),
+            )
+            .scalar_subquery()
+        )
+    slot_filters = {
+        "last": None,
+        "active": _IS_ACTIVE_SENT_MOVEMENT,
+        "location": _AFFECTS_LOCATION,
+        "event": _IS_JOURNEY_EVENT,
+    }
+    slot_selects = []
+    for slot, slot_filter in slot_filters.items():
+        newest_id = (
+            select(LogisticsEntry.id)
+            .where(LogisticsEntry.org_id == org_id, LogisticsEntry.part_id == part_id)
+            .order_by(
+                func.coalesce(LogisticsEntry.sent_at, LogisticsEntry.created_at).desc(),
+                LogisticsEntry.id.desc(),
+            )
+            .limit(1)
+        )
+        if slot_filter is not None:
+            newest_id = newest_id.where(slot_filter)
+        slot_selects.append(
+            select(
+                LogisticsEntry,
+                literal(slot).label("slot"),
+                _MOVEMENT_EVENT_TS.label("event_ts"),
+                (cooperation_received if slot == "last" else literal(0)).label("cooperation_received"),
+            )
+            .where(LogisticsEntry.id == newest_id.scalar_subquery())
+        )
+
+    rows = db.execute(
+        select(LogisticsEntry, column("slot"), column("event_ts"), column("cooperation_received"))
+        .from_statement(union_all(*slot_selects))
+    ).all()
+    slots = {row.slot: row for row in rows}
+    last_row = slots.get("last")
+    event_row = slots.get("event")
+    return _JourneyMovements(
+        last=last_row.LogisticsEntry if last_row else None,
+        active=slots["active"].LogisticsEntry if "active" in slots else None,
+        location=slots["location"].LogisticsEntry if "location" in slots else None,
+        event=event_row.LogisticsEntry if event_row else None,
+        event_ts=event_row.event_ts if event_row else None,
+        cooperation_received=int(last_row.cooperation_received or 0) if last_row else 0,
     )
 
 
 def _next_required_stage(part: Part) -> str | None:
-    stage_status_map = {stage_status.stage: stage_status for stage_status in (part.stage_statuses or [])}
+    status_by_stage = {stage_status.stage: stage_status.status for stage_status in (part.stage_statuses or ())}
     for stage in STAGE_FLOW_ORDER:
-        stage_status = stage_status_map.get(stage)
-        if stage_status and stage_status.status in {"pending", "in_progress"}:
+        if status_by_stage.get(stage) in OPEN_STAGE_STATUSES:
             return stage
     return None
 
 
-def _derive_current_location_and_holder(movement: LogisticsEntry | None) -> tuple[str | None, str | None]:
-    if not movement:
-        return None, None
-
-    status = normalize_movement_status(movement.status)
-    if status == "received":
-        return movement.to_location or movement.from_location, movement.to_holder or movement.from_holder
-    if status in {"returned", "cancelled"}:
-        return movement.from_location or movement.to_location, movement.from_holder or movement.to_holder
-    # sent / in_transit / legacy pending
-    return (
-        movement.to_location or movement.from_location,
-        movement.to_holder or movement.carrier or movement.from_holder,
-    )
-
-
-def _movement_affects_location(movement: LogisticsEntry | None) -> bool:
-    if not movement:
-        return False
-    return has_real_shipment_semantics(status=movement.status, sent_at=movement.sent_at)
+@dataclass(frozen=True, slots=True)
+class LocationInfo:
+    location: str | None
+    holder: str | None
 
 
-def _apply_cooperation_location_fallback(
-    *,
+def _resolve_location(
     part: Part,
-    current_location: str | None,
-    current_holder: str | None,
-) -> tuple[str | None, str | None]:
-    if not part.is_cooperation:
-        return current_location, current_holder
-
-    resolved_location = current_location or "У кооператора"
-    resolved_holder = current_holder or part.cooperation_partner or "Партнёр не указан"
-    return resolved_location, resolved_holder
-
-
-def _apply_cooperation_partial_location(
+    movement: LogisticsEntry | None,
     *,
-    part: Part,
-    current_location: str | None,
-    current_holder: str | None,
-    received_qty: int,
-) -> tuple[str | None, str | None]:
+    status: str | None = None,
+    received_qty: int = 0,
+) -> LocationInfo:
+    """Where the part is and who holds it, from its latest location-bearing movement."""
+    location: str | None = None
+    holder: str | None = None
+    if movement:
+        if status is None:
+            status = normalize_movement_status(movement.status)
+        if status == "received":
+            location = movement.to_location or movement.from_location
+            holder = movement.to_holder or movement.from_holder
+        elif status in {"returned", "cancelled"}:
+            location = movement.from_location or movement.to_location
+            holder = movement.from_holder or movement.to_holder
+        else:
+            # sent / in_transit / legacy pending
+            location = movement.to_location or movement.from_location
+            holder = movement.to_holder or movement.carrier or movement.from_holder
+
     if not part.is_cooperation:
-        return current_location, current_holder
+        return LocationInfo(location=location, holder=holder)
 
+    # Cooperation: partly received batches sit in two places; otherwise default to the partner.
     qty_plan = int(part.qty_plan or 0)
-    if qty_plan <= 0:
-        return current_location, current_holder
+    if qty_plan > 0 and 0 < received_qty < qty_plan:
+        return LocationInfo(location="Кооператор + Цех", holder=f"В цехе {received_qty} из {qty_plan} шт")
+    return LocationInfo(
+        location=location or "У кооператора",
+        holder=holder or part.cooperation_partner or "Партнёр не указан",
+    )
+
 
-    if 0 < received_qty < qty_plan:
-        return "Кооператор + Цех", f"В цехе {received_qty} из {qty_plan} шт"
-    return current_location, current_holder
+def _movement_affects_location(movement: LogisticsEntry | None) -> bool:
+    if not movement:
+        return False
+    return has_real_shipment_semantics(status=movement.status, sent_at=movement.sent_at)
 
 
 def _resolve_eta(part: Part, active_movement: LogisticsEntry | None) -> datetime | None:
@@ -382,46 +433,9 @@ def _resolve_eta(part: Part, active_movement: LogisticsEntry | None) -> datetime
 
 
 def _to_movement_out_safe(movement: LogisticsEntry) -> MovementOut:
-    try:
-        return MovementOut.model_validate(movement)
-    except (ValidationError, TypeError, ValueError):
-        fallback_ts = movement.updated_at or movement.created_at or _now_utc()
-        base_payload = {
-            "id": movement.id,
-            "part_id": movement.part_id,
-            "status": normalize_movement_status(movement.status),
-            "from_location": movement.from_location,
-            "from_holder": movement.from_holder,
-            "to_location": movement.to_location,
-            "to_holder": movement.to_holder,
-            "carrier": movement.carrier,
-            "tracking_number": movement.tracking_number,
-            "planned_eta": movement.planned_eta,
-            "sent_at": movement.sent_at,
-            "received_at": movement.received_at,
-            "returned_at": movement.returned_at,
-            "cancelled_at": movement.cancelled_at,
-            "qty_sent": movement.qty_sent,
-            "qty_received": movement.qty_received,
-            "stage_id": movement.stage_id,
-            "last_tracking_status": movement.last_tracking_status,
-            "tracking_last_checked_at": movement.tracking_last_checked_at,
-            "raw_payload": movement.raw_payload,
-            "notes": movement.notes,
-            "type": movement.type,
-            "description": movement.description,
-            "quantity": movement.quantity,
-            "date": movement.date,
-            "counterparty": movement.counterparty,
-            "created_at": movement.created_at or fallback_ts,
-            "updated_at": movement.updated_at or fallback_ts,
-        }
-        try:
-            return MovementOut(**base_payload)
-        except (ValidationError, TypeError, ValueError):
-            # Last-resort fallback for legacy edge-cases on nullable date serialization.
-            base_payload["date"] = None
-            return MovementOut(**base_payload)
+    return build_movement_out(movement)
+
+
 def _get_stage_status_in_org(
     db: Session,
     *,
@@ -442,14 +456,21 @@ def _get_stage_status_in_org(
     return stage_status
 
 
+def _movement_json_response(movement: MovementOut) -> Response:
+    # The use case already built a typed MovementOut; dump it once instead of letting
+    # response_model dump, re-validate and encode it again. response_model stays for OpenAPI.
+    return Response(content=movement.model_dump_json(), media_type="application/json")
+
+
 MOVEMENT_USE_CASE_HOOKS = MovementUseCaseHooks(
     get_stage_status_in_org=_get_stage_status_in_org,
     ensure_stage_movement_allowed=_ensure_stage_movement_allowed,
-    count_active_movements=_count_active_movements,
+    has_active_movement=_has_active_movement,
     is_cooperation_inbound=_is_cooperation_inbound,
     ensure_cooperation_receive_limit=_ensure_cooperation_receive_limit,
     now_utc=_now_utc,
     to_movement_out_safe=_to_movement_out_safe,
+    invalidate_part_read_cache=invalidate_part_read_cache,
 )
 
 
@@ -464,13 +485,14 @@ def create_movement(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    return create_movement_use_case(
+    movement = create_movement_use_case(
         part_id=part_id,
         data=data,
         current_user=current_user,
         db=db,
         hooks=MOVEMENT_USE_CASE_HOOKS,
     )
+    return _movement_json_response(movement)
 
 
 @router.patch(
@@ -484,13 +506,14 @@ def update_movement(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    return update_movement_use_case(
+    movement = update_movement_use_case(
         movement_id=movement_id,
         data=data,
         current_user=current_user,
         db=db,
         hooks=MOVEMENT_USE_CASE_HOOKS,
     )
+    return _movement_json_response(movement)
 
 
 @router.get("/parts/{part_id}/movements", response_model=list[MovementOut])
@@ -509,22 +532,31 @@ def get_part_movements(
     if not can_access_part(db, part, current_user):
         raise HTTPException(status_code=403, detail="Access denied")
 
+    cached = get_cached_part_read("movements", org_id=part.org_id, part_id=part.id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Plain Core rows: the list is serialized straight away, so skip identity-map hydration.
     movements = (
-        db.query(LogisticsEntry)
-        .filter(
+        select(*MOVEMENT_OUT_COLUMNS)
+        .where(
             LogisticsEntry.org_id == current_user.org_id,
             LogisticsEntry.part_id == part.id,
         )
         .order_by(func.coalesce(LogisticsEntry.sent_at, LogisticsEntry.created_at).desc())
     )
     try:
-        rows = movements.all()
+        rows = db.execute(movements).all()
     except ProgrammingError as error:
         raise HTTPException(
             status_code=500,
             detail="Ошибка схемы БД для перемещений. Требуется применить миграции backend (alembic upgrade head).",
         ) from error
-    return [_to_movement_out_safe(movement) for movement in rows]
+    # Serialize once in pydantic-core; the same JSON feeds the cache and the response, so
+    # FastAPI's response_model re-validation/encoding pass is skipped.
+    payload = _MOVEMENT_LIST_ADAPTER.dump_json([_to_movement_out_safe(movement) for movement in rows]).decode()
+    store_part_read("movements", org_id=part.org_id, part_id=part.id, payload=payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/parts/{part_id}/journey", response_model=JourneyOut)
@@ -533,25 +565,27 @@ def get_part_journey(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    part = require_org_entity(
-        db,
-        Part,
-        entity_id=part_id,
-        org_id=current_user.org_id,
-        not_found="Part not found",
-    )
+    # _next_required_stage walks stage_statuses; load them with the part instead of lazily.
+    part = db.execute(
+        select(Part)
+        .where(Part.id == part_id, Part.org_id == current_user.org_id)
+        .options(selectinload(Part.stage_statuses))
+    ).scalar_one_or_none()
+    if part is None:
+        raise HTTPException(status_code=404, detail="Part not found")
     if not can_access_part(db, part, current_user):
         raise HTTPException(status_code=403, detail="Access denied")
 
+    cached = get_cached_part_read("journey", org_id=part.org_id, part_id=part.id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        movements = (
-            db.query(LogisticsEntry)
-            .filter(
-                LogisticsEntry.org_id == current_user.org_id,
-                LogisticsEntry.part_id == part.id,
-            )
-            .order_by(func.coalesce(LogisticsEntry.sent_at, LogisticsEntry.created_at).desc())
-            .all()
+        journey_movements = _load_journey_movements(
+            db,
+            org_id=current_user.org_id,
+            part_id=part.id,
+            with_cooperation_received=bool(part.is_cooperation),
         )
     except ProgrammingError as error:
         raise HTTPException(
@@ -559,80 +593,47 @@ def get_part_journey(
             detail="Ошибка схемы БД для маршрута/перемещений. Требуется применить миграции backend (alembic upgrade head).",
         ) from error
 
-    last_movement = movements[0] if movements else None
-    active_movement = next(
-        (
-            m
-            for m in movements
-            if normalize_movement_status(m.status) in ACTIVE_MOVEMENT_STATUSES and m.sent_at is not None
-        ),
-        None,
-    )
-    location_movement = next(
-        (m for m in movements if _movement_affects_location(m)),
-        None,
-    )
-    cooperation_received_qty = (
-        _cooperation_received_qty(db=db, part=part)
-        if part.is_cooperation
-        else 0
-    )
-    current_location, current_holder = _derive_current_location_and_holder(active_movement or location_movement)
-    current_location, current_holder = _apply_cooperation_partial_location(
-        part=part,
-        current_location=current_location,
-        current_holder=current_holder,
-        received_qty=cooperation_received_qty,
+    last_movement = journey_movements.last
+    active_movement = journey_movements.active
+    movement_for_event = journey_movements.event
+    movement_ts = journey_movements.event_ts
+
+    # A fact only becomes last_event when it is strictly newer than the movement event
+    # (ties go to the movement), so only such a fact needs to be read.
+    latest_fact_query = select(StageFact.stage, StageFact.created_at).where(
+        StageFact.org_id == current_user.org_id,
+        StageFact.part_id == part.id,
     )
-    current_location, current_holder = _apply_cooperation_location_fallback(
-        part=part,
-        current_location=current_location,
-        current_holder=current_holder,
+    if movement_ts is not None:
+        latest_fact_query = latest_fact_query.where(StageFact.created_at > movement_ts)
+    newer_fact = db.execute(latest_fact_query.order_by(StageFact.created_at.desc()).limit(1)).first()
+
+    location_source = active_movement or journey_movements.location
+    location_info = _resolve_location(
+        part,
+        location_source,
+        status=normalize_movement_status(location_source.status) if location_source else None,
+        received_qty=journey_movements.cooperation_received,
     )
 
     eta = _resolve_eta(part, active_movement)
 
-    latest_fact = (
-        db.query(StageFact)
-        .filter(
-            StageFact.org_id == current_user.org_id,
-            StageFact.part_id == part.id,
+    if newer_fact is not None and newer_fact.created_at:
+        stage_label = STAGE_LABELS.get(newer_fact.stage, newer_fact.stage)
+        last_event = JourneyEventOut.model_construct(
+            event_type="fact",
+            occurred_at=newer_fact.created_at,
+            description=f"Факт этапа: {stage_label}",
         )
-        .order_by(StageFact.created_at.desc())
-        .first()
-    )
-
-    movement_for_event = next(
-        (
-            m
-            for m in movements
-            if normalize_movement_status(m.status) != "pending"
-            and not (
-                normalize_movement_status(m.status) in ACTIVE_MOVEMENT_STATUSES and m.sent_at is None
-            )
-        ),
-        None,
-    )
-
-    movement_ts = _movement_event_timestamp(movement_for_event)
-    fact_ts = latest_fact.created_at if latest_fact else None
-
-    if movement_ts and (fact_ts is None or movement_ts >= fact_ts):
+    elif movement_ts:
         movement_status = normalize_movement_status(movement_for_event.status) if movement_for_event else "pending"
-        last_event = JourneyEventOut(
+        last_event = JourneyEventOut.model_construct(
             event_type="movement",
             occurred_at=movement_ts,
             description=f"Перемещение: {MOVEMENT_STATUS_LABELS.get(movement_status, movement_status)}",
         )
-    elif latest_fact and fact_ts:
-        stage_label = STAGE_LABELS.get(latest_fact.stage, latest_fact.stage)
-        last_event = JourneyEventOut(
-            event_type="fact",
-            occurred_at=fact_ts,
-            description=f"Факт этапа: {stage_label}",
-        )
     else:
-        last_event = JourneyEventOut(
+        last_event = JourneyEventOut.model_construct(
             event_type="part",
             occurred_at=part.created_at,
             description="Деталь создана",
@@ -642,12 +643,16 @@ def get_part_journey(
     if next_required_stage is None and part.is_cooperation and part.status != "done":
         next_required_stage = "qc"
 
-    return JourneyOut(
+    # Every field below is already typed by this handler; skip re-validating it before dumping.
+    journey = JourneyOut.model_construct(
         part_id=part.id,
-        current_location=current_location,
-        current_holder=current_holder,
+        current_location=location_info.location,
+        current_holder=location_info.holder,
         next_required_stage=next_required_stage,
         eta=eta,
         last_movement=_to_movement_out_safe(last_movement) if last_movement else None,
         last_event=last_event,
     )
+    payload = journey.model_dump_json()
+    store_part_read("journey", org_id=part.org_id, part_id=part.id, payload=payload)
+    return Response(content=payload, media_type="application/json")
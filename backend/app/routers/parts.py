@@ -1,12 +1,14 @@
 """Part endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from uuid import UUID
 from typing import Optional
 from datetime import date, datetime, timedelta
 import math
 from urllib.parse import urlparse
+from ..config import settings
 from ..database import get_db
 from ..models import (
     User,
@@ -28,7 +30,14 @@ from ..schemas import (
 )
 from ..auth import get_current_user, PermissionChecker
 from ..security import apply_part_visibility_scope, can_access_part
-from ..services.part_state import compute_stage_totals, recompute_part_state, validate_stage_flow
+from ..services.movement_rules import RECEIVED_MOVEMENT_STATUS_VALUES
+from ..services.part_read_cache import invalidate_part_read_cache
+from ..services.part_state import (
+    cached_stage_totals,
+    cached_stage_totals_for_parts,
+    recompute_part_state,
+    validate_stage_flow,
+)
 from ..use_cases.part_lifecycle import delete_part_use_case
 from ..use_cases.parts_related import get_parts_related_batch_use_case
 
@@ -41,6 +50,7 @@ COOP_ALLOWED_STAGES = COOP_REQUIRED_STAGES | COOP_OPTIONAL_STAGES
 SHOP_REQUIRED_STAGES = {"machining", "fitting", "qc"}
 SHOP_ALLOWED_STAGES = SHOP_REQUIRED_STAGES | {"galvanic", "heat_treatment"}
 STAGE_FLOW_ORDER = ["machining", "fitting", "heat_treatment", "galvanic", "grinding", "qc"]
+_STAGE_FLOW_INDEX = {stage: index for index, stage in enumerate(STAGE_FLOW_ORDER)}
 PROGRESS_STAGES = {"machining", "fitting", "galvanic", "heat_treatment", "grinding", "qc"}
 STAGE_LABELS = {
     "machining": "механообработка",
@@ -110,6 +120,37 @@ def _drawing_preview_url(value: str | None) -> str | None:
     return None
 
 
+# Part columns that PartResponse exposes as-is; read by name so no relationship is touched.
+_PART_RESPONSE_COLUMNS: tuple[str, ...] = tuple(
+    name for name in PartResponse.model_fields if name in Part.__table__.c
+)
+
+
+def _part_read_options(*loaders):
+    """Eager loaders for part reads; with SQL_RAISELOAD, any other relationship access raises."""
+    if settings.SQL_RAISELOAD:
+        return (*loaders, raiseload("*"))
+    return loaders
+
+
+def _part_response(
+    part: Part,
+    *,
+    progress: PartProgressResponse,
+    stage_statuses: list[StageStatusResponse],
+    forecast: Optional[PartForecastResponse] = None,
+) -> PartResponse:
+    return PartResponse(
+        **{name: getattr(part, name) for name in _PART_RESPONSE_COLUMNS},
+        qty_ready=part.qty_done,
+        drawing_preview_url=_drawing_preview_url(part.drawing_url),
+        progress=progress,
+        forecast=forecast,
+        stage_statuses=stage_statuses,
+        machine=MachineResponse.model_validate(part.machine) if part.machine else None,
+    )
+
+
 def _recompute_specification_status(db: Session, specification: Specification) -> None:
     """Keep specification status in sync when linked items are removed."""
     items = db.query(SpecItem).filter(SpecItem.specification_id == specification.id).all()
@@ -132,23 +173,13 @@ def _recompute_specification_status(db: Session, specification: Specification) -
 def _cooperation_received_qty(db: Session, *, part: Part) -> int:
     qty = (
         db.query(
-            func.coalesce(
-                func.sum(
-                    func.coalesce(
-                        LogisticsEntry.qty_received,
-                        LogisticsEntry.qty_sent,
-                        LogisticsEntry.quantity,
-                        0,
-                    )
-                ),
-                0,
-            )
+            func.coalesce(func.sum(LogisticsEntry.effective_qty), 0)
         )
         .filter(
             LogisticsEntry.org_id == part.org_id,
             LogisticsEntry.part_id == part.id,
             LogisticsEntry.stage_id.is_(None),
-            LogisticsEntry.status.in_(("received", "completed")),
+            LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUS_VALUES),
         )
         .scalar()
     )
@@ -184,7 +215,32 @@ def _assert_cooperation_qc_ready(db: Session, *, part: Part) -> None:
         )
 
 
-def calculate_part_progress(db: Session, part: Part) -> tuple[PartProgressResponse, list[StageStatusResponse]]:
+def _prefetch_page_progress(db: Session, parts: list[Part]) -> dict[UUID, int]:
+    """Warm stage totals for a page of parts and return their StageFact scrap totals.
+
+    Three grouped queries for the whole page instead of three per part.
+    """
+    if not parts:
+        return {}
+    cached_stage_totals_for_parts(db, parts)
+    rows = (
+        db.query(StageFact.part_id, func.coalesce(func.sum(StageFact.qty_scrap), 0))
+        .filter(
+            StageFact.part_id.in_([part.id for part in parts]),
+            StageFact.org_id.in_({part.org_id for part in parts}),
+        )
+        .group_by(StageFact.part_id)
+        .all()
+    )
+    return {part_id: int(scrap or 0) for part_id, scrap in rows}
+
+
+def calculate_part_progress(
+    db: Session,
+    part: Part,
+    *,
+    total_scrap: Optional[int] = None,
+) -> tuple[PartProgressResponse, list[StageStatusResponse]]:
     """
     Calculate part progress with BOTTLENECK approach (requirement C).
     
@@ -195,23 +251,24 @@ def calculate_part_progress(db: Session, part: Part) -> tuple[PartProgressRespon
     
     NO AVERAGING - only MIN (bottleneck).
     """
-    totals = compute_stage_totals(db, part=part)
-    total_scrap = (
-        db.query(func.coalesce(func.sum(StageFact.qty_scrap), 0))
-        .filter(
-            StageFact.part_id == part.id,
-            StageFact.org_id == part.org_id,
+    totals = cached_stage_totals(db, part=part)
+    if total_scrap is None:
+        total_scrap = (
+            db.query(func.coalesce(func.sum(StageFact.qty_scrap), 0))
+            .filter(
+                StageFact.part_id == part.id,
+                StageFact.org_id == part.org_id,
+            )
+            .scalar()
+            or 0
         )
-        .scalar()
-        or 0
-    )
 
     # Calculate per-stage statistics.
     stage_statuses_data = []
     stage_done_quantities = {}  # stage -> qty_done
     stage_statuses_ordered = sorted(
         part.stage_statuses,
-        key=lambda item: STAGE_FLOW_ORDER.index(item.stage) if item.stage in STAGE_FLOW_ORDER else len(STAGE_FLOW_ORDER)
+        key=lambda item: _STAGE_FLOW_INDEX.get(item.stage, len(STAGE_FLOW_ORDER))
     )
     
     for stage_status in stage_statuses_ordered:
@@ -269,13 +326,20 @@ def calculate_part_progress(db: Session, part: Part) -> tuple[PartProgressRespon
     return progress, stage_statuses_data
 
 
-def calculate_part_forecast(db: Session, part: Part, current_date: date) -> PartForecastResponse:
-    """Calculate part forecast."""
+def calculate_part_forecast(
+    db: Session,
+    part: Part,
+    current_date: date,
+    *,
+    progress: Optional[PartProgressResponse] = None,
+) -> PartForecastResponse:
+    """Calculate part forecast; pass `progress` when the caller already computed it."""
     deadline = part.deadline
     days_remaining = max(0, (deadline - current_date).days)
     shifts_remaining = days_remaining * 2  # 2 shifts per day
 
-    progress, _ = calculate_part_progress(db, part)
+    if progress is None:
+        progress, _ = calculate_part_progress(db, part)
     qty_remaining = max(0, part.qty_plan - progress.overall_qty_done)
 
     machining_norm = None
@@ -291,15 +355,16 @@ def calculate_part_forecast(db: Session, part: Part, current_date: date) -> Part
         )
     has_norm = bool(machining_norm and machining_norm.is_configured and machining_norm.qty_per_shift > 0)
 
+    # Only stage, date and qty_good feed the averages; skip hydrating full StageFact rows.
     stage_facts = (
-        db.query(StageFact)
+        db.query(StageFact.stage, StageFact.date, StageFact.qty_good)
         .filter(
             StageFact.part_id == part.id,
             StageFact.org_id == part.org_id,
         )
         .all()
     )
-    facts_by_stage: dict[str, list[StageFact]] = {}
+    facts_by_stage: dict[str, list] = {}
     for fact in stage_facts:
         facts_by_stage.setdefault(fact.stage, []).append(fact)
 
@@ -309,7 +374,7 @@ def calculate_part_forecast(db: Session, part: Part, current_date: date) -> Part
             in_progress_stage = stage_status.stage
             break
 
-    primary_facts: list[StageFact] = []
+    primary_facts: list = []
     if in_progress_stage and facts_by_stage.get(in_progress_stage):
         primary_facts = facts_by_stage[in_progress_stage]
     elif facts_by_stage.get("machining"):
@@ -395,24 +460,29 @@ def get_parts(
     total = query.count()
     
     # Apply pagination
-    parts = query.order_by(Part.deadline).offset(offset).limit(limit).all()
+    # Progress and the response read stage_statuses and machine for every part on the page;
+    # load them in two batched queries instead of two lazy loads per part.
+    parts = (
+        query.options(*_part_read_options(selectinload(Part.stage_statuses), selectinload(Part.machine)))
+        .order_by(Part.deadline)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
     
+    scrap_by_part = _prefetch_page_progress(db, parts)
+
     # Build responses with progress
     responses = []
     for part in parts:
-        progress, stage_statuses = calculate_part_progress(db, part)
+        progress, stage_statuses = calculate_part_progress(db, part, total_scrap=scrap_by_part.get(part.id, 0))
         
-        response_data = {
-            **{k: v for k, v in part.__dict__.items() if not k.startswith('_')},
-            'qty_ready': part.qty_done,
-            'drawing_preview_url': _drawing_preview_url(part.drawing_url),
-            'progress': progress,
-            'stage_statuses': stage_statuses,
-            'machine': MachineResponse.model_validate(part.machine) if part.machine else None
-        }
-        responses.append(PartResponse(**response_data))
-    
-    return PartListResponse(items=responses, total=total, limit=limit, offset=offset)
+        responses.append(_part_response(part, progress=progress, stage_statuses=stage_statuses))
+
+    # The page is already validated; dump it once instead of letting response_model re-validate
+    # and encode every nested part again. response_model stays for OpenAPI.
+    page = PartListResponse(items=responses, total=total, limit=limit, offset=offset)
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.post("/batch/related", response_model=PartRelatedBatchResponse)
@@ -437,7 +507,10 @@ def get_part(
     db: Session = Depends(get_db)
 ):
     """Get part by ID with full progress and forecast."""
-    part = db.query(Part).filter(
+    # The machine is many-to-one, so join it into the part row instead of a separate lazy load.
+    part = db.query(Part).options(
+        *_part_read_options(selectinload(Part.stage_statuses), joinedload(Part.machine))
+    ).filter(
         Part.id == part_id,
         Part.org_id == current_user.org_id
     ).first()
@@ -450,19 +523,9 @@ def get_part(
     
     # Calculate progress and forecast
     progress, stage_statuses = calculate_part_progress(db, part)
-    forecast = calculate_part_forecast(db, part, date.today())
-    
-    response_data = {
-        **{k: v for k, v in part.__dict__.items() if not k.startswith('_')},
-        'qty_ready': part.qty_done,
-        'drawing_preview_url': _drawing_preview_url(part.drawing_url),
-        'progress': progress,
-        'forecast': forecast,
-        'stage_statuses': stage_statuses,
-        'machine': MachineResponse.model_validate(part.machine) if part.machine else None
-    }
+    forecast = calculate_part_forecast(db, part, date.today(), progress=progress)
     
-    return PartResponse(**response_data)
+    return _part_response(part, progress=progress, stage_statuses=stage_statuses, forecast=forecast)
 
 
 @router.post("/recompute-all", dependencies=[Depends(PermissionChecker("canEditFacts"))])
@@ -487,7 +550,11 @@ def recompute_all_parts(
             continue
         updated += 1
 
+    # Every part was recomputed (violations are reported, not rolled back); drop their cached reads.
+    part_keys = [(part.org_id, part.id) for part in parts]
     db.commit()
+    for org_id, part_id in part_keys:
+        invalidate_part_read_cache(org_id, part_id)
     return {"updated": updated, "violations": violations}
 
 
@@ -513,17 +580,10 @@ def recompute_part(
 
     db.commit()
     db.refresh(part)
+    invalidate_part_read_cache(part.org_id, part.id)
 
     progress, stage_statuses = calculate_part_progress(db, part)
-    response_data = {
-        **{k: v for k, v in part.__dict__.items() if not k.startswith('_')},
-        'qty_ready': part.qty_done,
-        'drawing_preview_url': _drawing_preview_url(part.drawing_url),
-        'progress': progress,
-        'stage_statuses': stage_statuses,
-        'machine': MachineResponse.model_validate(part.machine) if part.machine else None
-    }
-    return PartResponse(**response_data)
+    return _part_response(part, progress=progress, stage_statuses=stage_statuses)
 
 
 @router.post("", response_model=PartResponse, dependencies=[Depends(PermissionChecker("canCreateParts"))])
@@ -614,14 +674,11 @@ def create_part(
     db.add(part)
     db.flush()
     
-    # Create stage statuses for required stages
-    for stage in ordered_required_stages:
-        stage_status = PartStageStatus(
-            part_id=part.id,
-            stage=stage,
-            status='pending'
-        )
-        db.add(stage_status)
+    # Create stage statuses for required stages (one executemany, no unit-of-work tracking)
+    db.bulk_insert_mappings(
+        PartStageStatus,
+        [{"part_id": part.id, "stage": stage, "status": "pending"} for stage in ordered_required_stages],
+    )
 
     recompute_part_state(db, part=part)
     
@@ -644,16 +701,7 @@ def create_part(
     
     # Return with progress
     progress, stage_statuses = calculate_part_progress(db, part)
-    response_data = {
-        **{k: v for k, v in part.__dict__.items() if not k.startswith('_')},
-        'qty_ready': part.qty_done,
-        'drawing_preview_url': _drawing_preview_url(part.drawing_url),
-        'progress': progress,
-        'stage_statuses': stage_statuses,
-        'machine': MachineResponse.model_validate(part.machine) if part.machine else None
-    }
-    
-    return PartResponse(**response_data)
+    return _part_response(part, progress=progress, stage_statuses=stage_statuses)
 
 
 @router.put("/{part_id}", response_model=PartResponse, dependencies=[Depends(PermissionChecker("canEditParts"))])
@@ -731,19 +779,11 @@ def update_part(
     
     db.commit()
     db.refresh(part)
+    invalidate_part_read_cache(part.org_id, part.id)
     
     # Return with progress
     progress, stage_statuses = calculate_part_progress(db, part)
-    response_data = {
-        **{k: v for k, v in part.__dict__.items() if not k.startswith('_')},
-        'qty_ready': part.qty_done,
-        'drawing_preview_url': _drawing_preview_url(part.drawing_url),
-        'progress': progress,
-        'stage_statuses': stage_statuses,
-        'machine': MachineResponse.model_validate(part.machine) if part.machine else None
-    }
-    
-    return PartResponse(**response_data)
+    return _part_response(part, progress=progress, stage_statuses=stage_statuses)
 
 
 @router.delete("/{part_id}", status_code=204, dependencies=[Depends(PermissionChecker("canCreateParts"))])
@@ -809,28 +849,29 @@ def upsert_part_norm(
     if not machine:
         raise HTTPException(status_code=404, detail="Machine not found")
 
-    existing = db.query(MachineNorm).filter(
-        MachineNorm.part_id == part_id,
-        MachineNorm.machine_id == data.machine_id,
-        MachineNorm.stage == data.stage
-    ).first()
-
-    if existing:
-        existing.qty_per_shift = data.qty_per_shift
-        existing.is_configured = data.is_configured
-        existing.configured_by_id = current_user.id
-        norm = existing
-    else:
-        norm = MachineNorm(
+    # Single atomic upsert on uq_machine_norm; concurrent PUTs can't race into a duplicate insert.
+    stmt = (
+        pg_insert(MachineNorm)
+        .values(
             machine_id=data.machine_id,
             part_id=part_id,
             stage=data.stage,
             qty_per_shift=data.qty_per_shift,
             is_configured=data.is_configured,
-            configured_by_id=current_user.id
+            configured_by_id=current_user.id,
         )
-        db.add(norm)
-        db.flush()
+        .on_conflict_do_update(
+            constraint="uq_machine_norm",
+            set_={
+                "qty_per_shift": data.qty_per_shift,
+                "is_configured": data.is_configured,
+                "configured_by_id": current_user.id,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(MachineNorm)
+    )
+    norm = db.scalars(stmt, execution_options={"populate_existing": True}).one()
 
     audit = AuditEvent(
         org_id=current_user.org_id,
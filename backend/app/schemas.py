@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import date, datetime
+from datetime import date as date_type
 from uuid import UUID
 
 
@@ -513,7 +514,8 @@ class MovementOut(BaseModel):
     type: Optional[str] = None
     description: Optional[str] = None
     quantity: Optional[int] = None
-    date: Optional[date] = None
+    # ``date`` the field shadows ``date`` the type inside the class body; annotate via the alias.
+    date: Optional[date_type] = None
     counterparty: Optional[str] = None
 
     created_at: datetime
@@ -109,25 +109,21 @@ def can_access_part(db: Session, part: Part, current_user: User) -> bool:
     if check_permission(current_user, "canManageSpecifications"):
         return True
 
-    linked_spec_ids = {
-        row[0]
-        for row in db.query(SpecItem.specification_id).join(
-            Specification,
-            SpecItem.specification_id == Specification.id,
-        ).filter(
-            SpecItem.part_id == part.id,
-            Specification.org_id == current_user.org_id,
-        ).distinct().all()
-    }
+    # One EXISTS probe per check; the visible spec set stays a subquery instead of being fetched.
+    linked_spec_items = db.query(SpecItem.id).join(
+        Specification,
+        SpecItem.specification_id == Specification.id,
+    ).filter(
+        SpecItem.part_id == part.id,
+        Specification.org_id == current_user.org_id,
+    )
 
     if current_user.role == "operator":
-        if not linked_spec_ids:
-            return False
-        visible_spec_ids = {row[0] for row in _operator_visible_specification_ids_query(db, current_user).all()}
-        return bool(linked_spec_ids.intersection(visible_spec_ids))
+        visible_spec_ids = _operator_visible_specification_ids_query(db, current_user)
+        return bool(db.query(linked_spec_items.filter(Specification.id.in_(visible_spec_ids)).exists()).scalar())
 
     if not check_permission(current_user, "canViewSpecifications"):
-        return not linked_spec_ids
+        return not db.query(linked_spec_items.exists()).scalar()
 
     return True
 
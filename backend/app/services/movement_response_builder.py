@@ -0,0 +1,28 @@
+"""Movement response serialization helpers."""
+from __future__ import annotations
+
+from sqlalchemy import Row
+
+from ..models import LogisticsEntry
+from ..schemas import MovementOut
+from .movement_rules import normalize_movement_status, now_utc
+
+_MOVEMENT_OUT_FIELDS: tuple[str, ...] = tuple(MovementOut.model_fields)
+# Table columns behind MovementOut, for Core selects that skip ORM hydration entirely.
+MOVEMENT_OUT_COLUMNS = tuple(LogisticsEntry.__table__.c[field] for field in _MOVEMENT_OUT_FIELDS)
+
+
+def build_movement_out(movement: LogisticsEntry | Row) -> MovementOut:
+    """Build a MovementOut from a stored row (ORM entity or Core row) without re-validation."""
+    try:
+        payload = {field: getattr(movement, field) for field in _MOVEMENT_OUT_FIELDS}
+    except AttributeError:
+        # Not a full LogisticsEntry row; let pydantic validate whatever it is.
+        return MovementOut.model_validate(movement)
+
+    # ORM rows are already typed, so skip the validator pass. Legacy rows may lack timestamps.
+    fallback_ts = payload["updated_at"] or payload["created_at"] or now_utc()
+    payload["status"] = normalize_movement_status(payload["status"])
+    payload["created_at"] = payload["created_at"] or fallback_ts
+    payload["updated_at"] = payload["updated_at"] or fallback_ts
+    return MovementOut.model_construct(**payload)
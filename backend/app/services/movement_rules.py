@@ -6,16 +6,20 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 
-ACTIVE_MOVEMENT_STATUSES: set[str] = {"sent", "in_transit"}
-_TERMINAL_STATUSES: set[str] = {"received", "returned", "cancelled", "completed"}
-_ALLOWED_TRANSITIONS: dict[str, set[str]] = {
-    "pending": {"sent", "cancelled"},
-    "sent": {"in_transit", "received", "returned", "cancelled"},
-    "in_transit": {"received", "returned", "cancelled"},
-    "received": set(),
-    "returned": set(),
-    "cancelled": set(),
-    "completed": set(),
+ACTIVE_MOVEMENT_STATUSES: frozenset[str] = frozenset({"sent", "in_transit"})
+RECEIVED_MOVEMENT_STATUSES: frozenset[str] = frozenset({"received", "completed"})
+# Fixed-order tuples for SQL IN filters, so every query renders the same statement text.
+ACTIVE_MOVEMENT_STATUS_VALUES: tuple[str, ...] = tuple(sorted(ACTIVE_MOVEMENT_STATUSES))
+RECEIVED_MOVEMENT_STATUS_VALUES: tuple[str, ...] = tuple(sorted(RECEIVED_MOVEMENT_STATUSES))
+_TERMINAL_STATUSES: frozenset[str] = frozenset({"received", "returned", "cancelled", "completed"})
+_ALLOWED_TRANSITIONS: dict[str, frozenset[str]] = {
+    "pending": frozenset({"sent", "cancelled"}),
+    "sent": frozenset({"in_transit", "received", "returned", "cancelled"}),
+    "in_transit": frozenset({"received", "returned", "cancelled"}),
+    "received": frozenset(),
+    "returned": frozenset(),
+    "cancelled": frozenset(),
+    "completed": frozenset(),
 }
 
 
@@ -26,6 +30,9 @@ def now_utc() -> datetime:
 def normalize_movement_status(status: str | None) -> str:
     if not status:
         return "pending"
+    # Stored statuses are already canonical (chk_logistics_status); skip the string copies.
+    if status in _ALLOWED_TRANSITIONS:
+        return status
     return status.strip().lower()
 
 
@@ -44,7 +51,7 @@ def validate_status_transition(*, current_status: str | None, next_status: str |
     if nxt == current:
         return nxt
 
-    allowed = _ALLOWED_TRANSITIONS.get(current, set())
+    allowed = _ALLOWED_TRANSITIONS.get(current, frozenset())
     if nxt not in allowed:
         raise ValueError(f"Invalid movement status transition: {current} -> {nxt}")
     return nxt
@@ -62,9 +69,15 @@ def ensure_not_cancelled_to_received(*, current_status: str | None, next_status:
         raise ValueError("Cannot change movement after cancelled")
 
 
+def enters_active_status(*, current_status: str | None, next_status: str) -> bool:
+    current = normalize_movement_status(current_status)
+    nxt = normalize_movement_status(next_status)
+    return nxt in ACTIVE_MOVEMENT_STATUSES and current not in ACTIVE_MOVEMENT_STATUSES
+
+
 def ensure_single_active_movement(
     *,
-    existing_active_count: int,
+    has_other_active: bool,
     current_status: str | None,
     next_status: str,
     allow_parallel: bool,
@@ -72,9 +85,7 @@ def ensure_single_active_movement(
     if allow_parallel:
         return
 
-    current = normalize_movement_status(current_status)
-    nxt = normalize_movement_status(next_status)
-    if nxt in ACTIVE_MOVEMENT_STATUSES and current not in ACTIVE_MOVEMENT_STATUSES and existing_active_count > 0:
+    if has_other_active and enters_active_status(current_status=current_status, next_status=next_status):
         raise ValueError("Another active movement already exists for this part")
 
 
@@ -89,7 +100,7 @@ def is_terminal_status(status: str | None) -> bool:
 
 def has_real_shipment_semantics(*, status: str | None, sent_at: datetime | None) -> bool:
     current = normalize_movement_status(status)
-    if current in {"sent", "in_transit"}:
+    if current in ACTIVE_MOVEMENT_STATUSES:
         return sent_at is not None
     return current in {"received", "returned", "cancelled"}
 
@@ -111,7 +122,7 @@ def apply_status_timestamps(
     updated_returned_at = returned_at
     updated_cancelled_at = cancelled_at
 
-    if updated_sent_at is None and nxt in {"sent", "in_transit"}:
+    if updated_sent_at is None and nxt in ACTIVE_MOVEMENT_STATUSES:
         updated_sent_at = ts
     if nxt == "received" and updated_received_at is None:
         updated_received_at = ts
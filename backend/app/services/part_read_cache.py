@@ -0,0 +1,75 @@
+"""Short-lived Redis cache for per-part logistics reads (movements list, journey).
+
+Entries are keyed by (org_id, part_id) and store the serialized JSON response. Access
+checks still run on every request before the cache is consulted; the cached payload
+itself does not depend on who asked. Writers that touch a part's movements, facts or
+stage state call ``invalidate_part_read_cache`` after commit; the TTL bounds staleness
+for any writer that doesn't.
+
+Redis failures never break a request: reads miss and writes/invalidation are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+import redis
+from redis.exceptions import RedisError
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+PART_READ_CACHE_KINDS: tuple[str, ...] = ("movements", "journey")
+
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def _cache_key(kind: str, *, org_id: UUID, part_id: UUID) -> str:
+    return f"erp-mes:part-read:{kind}:{org_id}:{part_id}"
+
+
+def _enabled() -> bool:
+    return settings.PART_READ_CACHE_TTL_SECONDS > 0
+
+
+def get_cached_part_read(kind: str, *, org_id: UUID, part_id: UUID) -> str | None:
+    if not _enabled():
+        return None
+    try:
+        return _get_redis().get(_cache_key(kind, org_id=org_id, part_id=part_id))
+    except RedisError:
+        logger.warning("Redis error reading part %s cache (miss)", kind, exc_info=True)
+        return None
+
+
+def store_part_read(kind: str, *, org_id: UUID, part_id: UUID, payload: str) -> None:
+    if not _enabled():
+        return
+    try:
+        _get_redis().set(
+            _cache_key(kind, org_id=org_id, part_id=part_id),
+            payload,
+            ex=settings.PART_READ_CACHE_TTL_SECONDS,
+        )
+    except RedisError:
+        logger.warning("Redis error storing part %s cache (skipped)", kind, exc_info=True)
+
+
+def invalidate_part_read_cache(org_id: UUID, part_id: UUID) -> None:
+    if not _enabled():
+        return
+    try:
+        _get_redis().delete(
+            *(_cache_key(kind, org_id=org_id, part_id=part_id) for kind in PART_READ_CACHE_KINDS)
+        )
+    except RedisError:
+        logger.warning("Redis error invalidating part read cache", exc_info=True)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import event, func
 from sqlalchemy.orm import Session
 
 from ..models import LogisticsEntry, Part, PartStageStatus, StageFact
+from .movement_rules import RECEIVED_MOVEMENT_STATUS_VALUES
 
 
 PROGRESS_STAGES: tuple[str, ...] = (
@@ -22,7 +24,6 @@ PROGRESS_STAGES: tuple[str, ...] = (
 
 INTERNAL_FACT_STAGES: tuple[str, ...] = ("machining", "fitting", "qc")
 EXTERNAL_MOVEMENT_STAGES: tuple[str, ...] = ("heat_treatment", "galvanic", "grinding")
-RECEIVED_MOVEMENT_STATUSES: tuple[str, ...] = ("received", "completed")
 
 
 STAGE_LABELS_RU: dict[str, str] = {
@@ -92,8 +93,20 @@ def stage_prerequisites(part: Part, stage: str) -> list[str]:
 
 
 def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
+    return compute_stage_totals_for_parts(db, [part])[part.id]
+
+
+def compute_stage_totals_for_parts(db: Session, parts: Sequence[Part]) -> dict[UUID, dict[str, StageTotals]]:
+    """`compute_stage_totals` for several parts in two grouped queries."""
+    totals_by_part: dict[UUID, dict[str, StageTotals]] = {part.id: {} for part in parts}
+    if not parts:
+        return totals_by_part
+    part_ids = list(totals_by_part)
+    org_ids = list({part.org_id for part in parts})
+
     fact_rows = (
         db.query(
+            StageFact.part_id.label("part_id"),
             StageFact.stage.label("stage"),
             func.coalesce(func.sum(StageFact.qty_good), 0).label("good"),
             func.coalesce(func.sum(StageFact.qty_scrap), 0).label("scrap"),
@@ -102,16 +115,15 @@ def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
             func.max(StageFact.created_at).label("last_at"),
         )
         .filter(
-            StageFact.part_id == part.id,
-            StageFact.org_id == part.org_id,
+            StageFact.part_id.in_(part_ids),
+            StageFact.org_id.in_(org_ids),
         )
-        .group_by(StageFact.stage)
+        .group_by(StageFact.part_id, StageFact.stage)
         .all()
     )
 
-    totals: dict[str, StageTotals] = {}
     for row in fact_rows:
-        totals[str(row.stage)] = StageTotals(
+        totals_by_part[row.part_id][str(row.stage)] = StageTotals(
             good=int(row.good or 0),
             scrap=int(row.scrap or 0),
             facts_count=int(row.facts_count or 0),
@@ -121,18 +133,9 @@ def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
 
     movement_rows = (
         db.query(
+            LogisticsEntry.part_id.label("part_id"),
             PartStageStatus.stage.label("stage"),
-            func.coalesce(
-                func.sum(
-                    func.coalesce(
-                        LogisticsEntry.qty_received,
-                        LogisticsEntry.qty_sent,
-                        LogisticsEntry.quantity,
-                        0,
-                    )
-                ),
-                0,
-            ).label("good"),
+            func.coalesce(func.sum(LogisticsEntry.effective_qty), 0).label("good"),
             func.count(LogisticsEntry.id).label("events_count"),
             func.min(
                 func.coalesce(
@@ -156,19 +159,19 @@ def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
             PartStageStatus.id == LogisticsEntry.stage_id,
         )
         .filter(
-            LogisticsEntry.part_id == part.id,
-            LogisticsEntry.org_id == part.org_id,
+            LogisticsEntry.part_id.in_(part_ids),
+            LogisticsEntry.org_id.in_(org_ids),
             LogisticsEntry.stage_id.isnot(None),
-            LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUSES),
-            PartStageStatus.part_id == part.id,
+            LogisticsEntry.status.in_(RECEIVED_MOVEMENT_STATUS_VALUES),
+            PartStageStatus.part_id == LogisticsEntry.part_id,
             PartStageStatus.stage.in_(EXTERNAL_MOVEMENT_STAGES),
         )
-        .group_by(PartStageStatus.stage)
+        .group_by(LogisticsEntry.part_id, PartStageStatus.stage)
         .all()
     )
 
     for row in movement_rows:
-        totals[str(row.stage)] = StageTotals(
+        totals_by_part[row.part_id][str(row.stage)] = StageTotals(
             good=int(row.good or 0),
             scrap=0,
             facts_count=int(row.events_count or 0),
@@ -176,7 +179,10 @@ def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
             last_at=row.last_at,
         )
 
-    if part.is_cooperation:
+    for part in parts:
+        if not part.is_cooperation:
+            continue
+        totals = totals_by_part[part.id]
         qc_status = (part.cooperation_qc_status or "pending").strip().lower()
         checked_at = part.cooperation_qc_checked_at
         if qc_status == "accepted":
@@ -198,9 +204,72 @@ def compute_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
         elif "qc" not in totals:
             totals["qc"] = StageTotals()
 
+    return totals_by_part
+
+
+_STAGE_TOTALS_CACHE_KEY = "stage_totals_by_part"
+
+
+def cached_stage_totals(db: Session, *, part: Part) -> dict[str, StageTotals]:
+    """`compute_stage_totals` memoized on the session until its next flush, commit or rollback.
+
+    Callers must treat the returned dict as read-only; it is shared within the request.
+    """
+    cache = db.info.setdefault(_STAGE_TOTALS_CACHE_KEY, {})
+    totals = cache.get(part.id)
+    if totals is None:
+        totals = cache[part.id] = compute_stage_totals(db, part=part)
     return totals
 
 
+def cached_stage_totals_for_parts(db: Session, parts: Sequence[Part]) -> None:
+    """Warm the `cached_stage_totals` cache for a page of parts in one batch."""
+    cache = db.info.setdefault(_STAGE_TOTALS_CACHE_KEY, {})
+    missing = [part for part in parts if part.id not in cache]
+    if missing:
+        cache.update(compute_stage_totals_for_parts(db, missing))
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _drop_cached_stage_totals(session: Session, *_args) -> None:
+    session.info.pop(_STAGE_TOTALS_CACHE_KEY, None)
+
+
+def with_added_fact(
+    stage_totals: dict[str, StageTotals],
+    *,
+    part: Part,
+    stage: str,
+    qty_good: int,
+    qty_scrap: int,
+    created_at: object,
+) -> dict[str, StageTotals]:
+    """Return a copy of `stage_totals` as if one more fact had been recorded for `stage`.
+
+    Mirrors `compute_stage_totals`, so a decided cooperation QC status still wins over facts
+    and the new fact's `created_at` becomes the stage's latest (and, if first, earliest) time.
+    """
+    if part.is_cooperation and stage == "qc":
+        qc_status = (part.cooperation_qc_status or "pending").strip().lower()
+        if qc_status in {"accepted", "rejected"}:
+            return dict(stage_totals)
+
+    current = stage_totals.get(stage, StageTotals())
+    return {
+        **stage_totals,
+        stage: replace(
+            current,
+            good=int(current.good or 0) + int(qty_good or 0),
+            scrap=int(current.scrap or 0) + int(qty_scrap or 0),
+            facts_count=current.facts_count + 1,
+            first_at=current.first_at or created_at,
+            last_at=created_at,
+        ),
+    }
+
+
 def validate_stage_flow(part: Part, stage_totals: dict[str, StageTotals]) -> Optional[str]:
     """Validate that downstream stages never process more than available input from prerequisites."""
     required_stages = set(part.required_stages or [])
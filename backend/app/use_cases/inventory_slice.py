@@ -19,12 +19,13 @@ from ..schemas import (
     MovementCreate,
 )
 from ..security import apply_part_visibility_scope, can_access_part, require_org_entity
-from ..services.movement_rules import normalize_movement_status
+from ..services.movement_rules import (
+    ACTIVE_MOVEMENT_STATUSES,
+    RECEIVED_MOVEMENT_STATUSES,
+    normalize_movement_status,
+)
 from .movements_use_cases import MovementUseCaseHooks, create_movement_use_case
 
-_RECEIVED_STATUSES: tuple[str, ...] = ("received", "completed")
-_OUTBOUND_STATUSES: tuple[str, ...] = ("sent", "in_transit")
-
 
 def _qty_value(movement: LogisticsEntry) -> int:
     return int(movement.qty_received or movement.qty_sent or movement.quantity or 0)
@@ -54,9 +55,9 @@ def _map_inventory_type(movement: LogisticsEntry) -> str:
         return raw_type
 
     status = normalize_movement_status(movement.status)
-    if status in _RECEIVED_STATUSES:
+    if status in RECEIVED_MOVEMENT_STATUSES:
         return "receipt"
-    if status in _OUTBOUND_STATUSES:
+    if status in ACTIVE_MOVEMENT_STATUSES:
         if (movement.to_location or "").strip().lower() in {"цех", "производство", "shop", "production"}:
             return "issue"
         return "transfer"
@@ -101,18 +102,18 @@ def list_inventory_metal_use_case(*, db: Session, current_user: User) -> list[In
     for movement in movements:
         status = normalize_movement_status(movement.status)
         qty = _qty_value(movement)
-        if status in _RECEIVED_STATUSES:
+        if status in RECEIVED_MOVEMENT_STATUSES:
             balance_by_part[movement.part_id] = balance_by_part.get(movement.part_id, 0) + qty
-        elif status in _OUTBOUND_STATUSES:
+        elif status in ACTIVE_MOVEMENT_STATUSES:
             balance_by_part[movement.part_id] = balance_by_part.get(movement.part_id, 0) - qty
         elif status == "returned":
             balance_by_part[movement.part_id] = balance_by_part.get(movement.part_id, 0) + qty
 
         if movement.part_id not in latest_by_part:
             latest_by_part[movement.part_id] = movement
-            if status in _RECEIVED_STATUSES:
+            if status in RECEIVED_MOVEMENT_STATUSES:
                 location_by_part[movement.part_id] = movement.to_location or movement.from_location or "Производство"
-            elif status in _OUTBOUND_STATUSES:
+            elif status in ACTIVE_MOVEMENT_STATUSES:
                 location_by_part[movement.part_id] = movement.from_location or movement.to_location or "В пути"
             else:
                 location_by_part[movement.part_id] = movement.to_location or movement.from_location or "Производство"
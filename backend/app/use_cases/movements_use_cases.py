@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Callable
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from ..domain_errors import DomainError
@@ -14,18 +15,49 @@ from ..models import AuditEvent, LogisticsEntry, Part, PartStageStatus, User
 from ..schemas import MovementCreate, MovementOut, MovementUpdate
 from ..security import can_access_part, require_org_entity
 from ..services.movement_rules import (
+    RECEIVED_MOVEMENT_STATUSES,
     apply_status_timestamps,
     ensure_not_cancelled_to_received,
     ensure_received_requires_sent,
     ensure_single_active_movement,
     ensure_stage_link_matches_part,
+    enters_active_status,
     initial_movement_state,
     normalize_movement_status,
     validate_status_transition,
 )
 from ..services.part_state import recompute_part_state
 
-RECEIVED_MOVEMENT_STATUSES: tuple[str, ...] = ("received", "completed")
+
+# MovementUpdate fields copied onto the row as-is when present in the request.
+_UPDATABLE_MOVEMENT_FIELDS: frozenset[str] = frozenset({
+    "from_location",
+    "from_holder",
+    "to_location",
+    "to_holder",
+    "carrier",
+    "tracking_number",
+    "planned_eta",
+    "qty_sent",
+    "qty_received",
+    "stage_id",
+    "notes",
+    "description",
+})
+
+
+def load_movement_with_part(db: Session, *, movement_id: UUID, org_id: UUID) -> tuple[LogisticsEntry, Part]:
+    """Load an org movement and its part in one round trip, or raise the matching 404."""
+    row = db.execute(
+        select(LogisticsEntry, Part)
+        .outerjoin(Part, and_(Part.id == LogisticsEntry.part_id, Part.org_id == org_id))
+        .where(LogisticsEntry.id == movement_id, LogisticsEntry.org_id == org_id)
+    ).first()
+    if row is None:
+        raise DomainError(code="MOVEMENT_NOT_FOUND", http_status=404, message="Movement not found")
+    if row.Part is None:
+        raise DomainError(code="PART_NOT_FOUND", http_status=404, message="Part not found")
+    return row.LogisticsEntry, row.Part
 
 
 @dataclass(frozen=True)
@@ -34,14 +66,16 @@ class MovementUseCaseHooks:
 
     get_stage_status_in_org: Callable[[Session, UUID, UUID], PartStageStatus] | None = None
     ensure_stage_movement_allowed: Callable[..., None] | None = None
-    count_active_movements: Callable[..., int] | None = None
+    has_active_movement: Callable[..., bool] | None = None
     is_cooperation_inbound: Callable[..., bool] | None = None
     ensure_cooperation_receive_limit: Callable[..., None] | None = None
     now_utc: Callable[[], datetime] | None = None
     to_movement_out_safe: Callable[[LogisticsEntry], MovementOut] | None = None
     resolve_org_entity: Callable[..., object] = require_org_entity
+    resolve_movement_with_part: Callable[..., tuple[LogisticsEntry, Part]] = load_movement_with_part
     can_access_part: Callable[[Session, Part, User], bool] = can_access_part
     recompute_part_state: Callable[[Session, Part], None] = recompute_part_state
+    invalidate_part_read_cache: Callable[[UUID, UUID], None] | None = None
 
 
 def _required(name: str, hook: object):
@@ -84,7 +118,7 @@ def create_movement_use_case(
         "ensure_stage_movement_allowed",
         hooks.ensure_stage_movement_allowed,
     )
-    count_active_movements = _required("count_active_movements", hooks.count_active_movements)
+    has_active_movement = _required("has_active_movement", hooks.has_active_movement)
     is_cooperation_inbound = _required("is_cooperation_inbound", hooks.is_cooperation_inbound)
     ensure_cooperation_receive_limit = _required(
         "ensure_cooperation_receive_limit",
@@ -148,15 +182,16 @@ def create_movement_use_case(
 
     requested_initial_status = normalize_movement_status(data.status)
     status = requested_initial_status
+    now = now_utc()
     sent_at: datetime | None = None
     received_at: datetime | None = None
 
     if requested_initial_status == "sent":
-        status, sent_at = initial_movement_state()
+        status, sent_at = initial_movement_state(at=now)
     elif requested_initial_status == "pending":
         status, sent_at = "pending", None
     elif requested_initial_status == "received":
-        sent_at = now_utc()
+        sent_at = now
         received_at = sent_at
         ensure_received_requires_sent(sent_at=sent_at, next_status="received")
     else:
@@ -195,10 +230,15 @@ def create_movement_use_case(
                 fallback_message="Stage movement validation failed",
             ) from exc
 
-    active_count = count_active_movements(db, org_id=current_user.org_id, part_id=part.id)
+    # Only a movement entering an active status can conflict; skip the lookup otherwise.
+    has_other_active = (
+        not data.allow_parallel
+        and enters_active_status(current_status=None, next_status=status)
+        and has_active_movement(db, org_id=current_user.org_id, part_id=part.id)
+    )
     try:
         ensure_single_active_movement(
-            existing_active_count=active_count,
+            has_other_active=has_other_active,
             current_status=None,
             next_status=status,
             allow_parallel=data.allow_parallel,
@@ -236,7 +276,9 @@ def create_movement_use_case(
                 fallback_message="Cooperation receive limit violated",
             ) from exc
 
+    # The id is assigned client-side so the audit row can reference it before the flush.
     movement = LogisticsEntry(
+        id=uuid4(),
         org_id=current_user.org_id,
         part_id=part.id,
         status=status,
@@ -257,13 +299,9 @@ def create_movement_use_case(
         type=data.type or "shipping_out",
         description=data.description or "Movement created",
         quantity=data.qty_sent,
-        date=(sent_at.date() if sent_at else datetime.now(timezone.utc).date()),
+        date=(sent_at or now).date(),
         counterparty=data.to_holder or data.to_location,
     )
-    db.add(movement)
-    db.flush()
-    hooks.recompute_part_state(db, part=part)
-
     audit = AuditEvent(
         org_id=current_user.org_id,
         action="movement_created",
@@ -283,11 +321,20 @@ def create_movement_use_case(
             "tracking_number": movement.tracking_number,
         },
     )
+    db.add(movement)
     db.add(audit)
+    # Sessions don't autoflush: write the movement (and its audit row) before recomputing totals.
+    db.flush()
+    hooks.recompute_part_state(db, part=part)
 
+    # The flush already returned the server-side columns; build the response before commit
+    # expires the instance instead of re-selecting it.
+    response = to_movement_out_safe(movement)
+    org_id, part_id = part.org_id, part.id
     db.commit()
-    db.refresh(movement)
-    return to_movement_out_safe(movement)
+    if hooks.invalidate_part_read_cache is not None:
+        hooks.invalidate_part_read_cache(org_id, part_id)
+    return response
 
 
 def update_movement_use_case(
@@ -303,7 +350,7 @@ def update_movement_use_case(
         "ensure_stage_movement_allowed",
         hooks.ensure_stage_movement_allowed,
     )
-    count_active_movements = _required("count_active_movements", hooks.count_active_movements)
+    has_active_movement = _required("has_active_movement", hooks.has_active_movement)
     is_cooperation_inbound = _required("is_cooperation_inbound", hooks.is_cooperation_inbound)
     ensure_cooperation_receive_limit = _required(
         "ensure_cooperation_receive_limit",
@@ -312,37 +359,11 @@ def update_movement_use_case(
     now_utc = _required("now_utc", hooks.now_utc)
     to_movement_out_safe = _required("to_movement_out_safe", hooks.to_movement_out_safe)
 
-    try:
-        movement = hooks.resolve_org_entity(
-            db,
-            LogisticsEntry,
-            entity_id=movement_id,
-            org_id=current_user.org_id,
-            not_found="Movement not found",
-        )
-    except HTTPException as exc:
-        raise _domain_error_from_http_exception(
-            exc=exc,
-            code="MOVEMENT_NOT_FOUND",
-            fallback_status=404,
-            fallback_message="Movement not found",
-        ) from exc
-
-    try:
-        part = hooks.resolve_org_entity(
-            db,
-            Part,
-            entity_id=movement.part_id,
-            org_id=current_user.org_id,
-            not_found="Part not found",
-        )
-    except HTTPException as exc:
-        raise _domain_error_from_http_exception(
-            exc=exc,
-            code="PART_NOT_FOUND",
-            fallback_status=404,
-            fallback_message="Part not found",
-        ) from exc
+    movement, part = hooks.resolve_movement_with_part(
+        db,
+        movement_id=movement_id,
+        org_id=current_user.org_id,
+    )
     if not hooks.can_access_part(db, part, current_user):
         raise DomainError(
             code="PART_ACCESS_DENIED",
@@ -350,10 +371,11 @@ def update_movement_use_case(
             message="Access denied",
         )
 
-    payload = data.model_dump(exclude_unset=True)
+    # Explicitly sent fields only; read them off the model instead of dumping it to a dict.
+    updated_fields = data.model_fields_set
 
-    next_qty_sent = payload.get("qty_sent", movement.qty_sent)
-    next_qty_received = payload.get("qty_received", movement.qty_received)
+    next_qty_sent = data.qty_sent if "qty_sent" in updated_fields else movement.qty_sent
+    next_qty_received = data.qty_received if "qty_received" in updated_fields else movement.qty_received
     if next_qty_sent is not None and next_qty_received is not None and next_qty_received > next_qty_sent:
         raise DomainError(
             code="MOVEMENT_INVALID_QUANTITY",
@@ -361,11 +383,11 @@ def update_movement_use_case(
             message="qty_received cannot exceed qty_sent",
         )
 
-    if "stage_id" in payload and payload["stage_id"]:
+    if data.stage_id:
         try:
             stage_status = get_stage_status_in_org(
                 db,
-                stage_id=payload["stage_id"],
+                stage_id=data.stage_id,
                 org_id=current_user.org_id,
             )
         except HTTPException as exc:
@@ -402,18 +424,22 @@ def update_movement_use_case(
             stage_status = None
 
     new_status = None
-    if "status" in payload and payload["status"] is not None:
-        requested_status = str(payload["status"])
+    if data.status is not None:
+        requested_status = data.status
         try:
             ensure_not_cancelled_to_received(current_status=movement.status, next_status=requested_status)
             new_status = validate_status_transition(current_status=movement.status, next_status=requested_status)
             ensure_received_requires_sent(sent_at=movement.sent_at, next_status=new_status)
             ensure_single_active_movement(
-                existing_active_count=count_active_movements(
-                    db,
-                    org_id=current_user.org_id,
-                    part_id=movement.part_id,
-                    exclude_movement_id=movement.id,
+                has_other_active=(
+                    not data.allow_parallel
+                    and enters_active_status(current_status=movement.status, next_status=new_status)
+                    and has_active_movement(
+                        db,
+                        org_id=current_user.org_id,
+                        part_id=movement.part_id,
+                        exclude_movement_id=movement.id,
+                    )
                 ),
                 current_status=movement.status,
                 next_status=new_status,
@@ -426,26 +452,12 @@ def update_movement_use_case(
                 message=str(error),
             ) from error
 
-    for field in (
-        "from_location",
-        "from_holder",
-        "to_location",
-        "to_holder",
-        "carrier",
-        "tracking_number",
-        "planned_eta",
-        "qty_sent",
-        "qty_received",
-        "stage_id",
-        "notes",
-        "description",
-    ):
-        if field in payload:
-            setattr(movement, field, payload[field])
+    for field in updated_fields & _UPDATABLE_MOVEMENT_FIELDS:
+        setattr(movement, field, getattr(data, field))
 
-    if "qty_sent" in payload:
-        movement.quantity = payload["qty_sent"]
-    if "to_holder" in payload or "to_location" in payload:
+    if "qty_sent" in updated_fields:
+        movement.quantity = data.qty_sent
+    if "to_holder" in updated_fields or "to_location" in updated_fields:
         movement.counterparty = movement.to_holder or movement.to_location
 
     if new_status:
@@ -462,15 +474,15 @@ def update_movement_use_case(
         movement.received_at = timestamp_updates["received_at"]
         movement.returned_at = timestamp_updates["returned_at"]
         movement.cancelled_at = timestamp_updates["cancelled_at"]
-        if new_status == "received" and payload.get("qty_received") is None and movement.qty_received is None:
+        if new_status == "received" and data.qty_received is None and movement.qty_received is None:
             movement.qty_received = movement.qty_sent
 
     effective_status = normalize_movement_status(new_status or movement.status)
     if stage_status is not None and (
-        "stage_id" in payload
-        or "qty_sent" in payload
-        or "qty_received" in payload
-        or "status" in payload
+        "stage_id" in updated_fields
+        or "qty_sent" in updated_fields
+        or "qty_received" in updated_fields
+        or "status" in updated_fields
     ) and effective_status in {"sent", "in_transit", "received"}:
         requested_stage_qty = (
             movement.qty_received
@@ -511,7 +523,7 @@ def update_movement_use_case(
             to_holder=movement.to_holder,
         )
         and any(
-            field in payload
+            field in updated_fields
             for field in (
                 "status",
                 "qty_sent",
@@ -539,8 +551,6 @@ def update_movement_use_case(
                 fallback_message="Cooperation receive limit violated",
             ) from exc
 
-    hooks.recompute_part_state(db, part=part)
-
     audit = AuditEvent(
         org_id=current_user.org_id,
         action="movement_status_changed",
@@ -561,7 +571,15 @@ def update_movement_use_case(
         },
     )
     db.add(audit)
+    # Sessions don't autoflush: write the edited movement before recomputing totals from it.
+    db.flush()
+    hooks.recompute_part_state(db, part=part)
 
+    # The flush already returned the server-side columns; build the response before commit
+    # expires the instance instead of re-selecting it.
+    response = to_movement_out_safe(movement)
+    org_id, part_id = part.org_id, part.id
     db.commit()
-    db.refresh(movement)
-    return to_movement_out_safe(movement)
+    if hooks.invalidate_part_read_cache is not None:
+        hooks.invalidate_part_read_cache(org_id, part_id)
+    return response
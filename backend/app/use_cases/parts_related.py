@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from ..models import LogisticsEntry, MachineNorm, Part, User
 from ..schemas import MachineNormResponse, MovementOut, PartRelatedBatchItem
 from ..security import apply_part_visibility_scope
+from ..services.movement_response_builder import build_movement_out
 
 
 def _normalize_part_ids(part_ids: Iterable[UUID]) -> list[UUID]:
@@ -73,7 +74,7 @@ def get_parts_related_batch_use_case(
     norms_by_part: dict[UUID, list[MachineNormResponse]] = defaultdict(list)
 
     for movement in movements:
-        movements_by_part[movement.part_id].append(MovementOut.model_validate(movement))
+        movements_by_part[movement.part_id].append(build_movement_out(movement))
 
     for norm in norms:
         norms_by_part[norm.part_id].append(MachineNormResponse.model_validate(norm))
@@ -98,7 +98,7 @@ def _hooks() -> MovementUseCaseHooks:
         recompute_part_state=lambda *_args, **_kwargs: None,
         get_stage_status_in_org=lambda *_args, **_kwargs: None,
         ensure_stage_movement_allowed=lambda **_kwargs: None,
-        count_active_movements=lambda _db, **_kwargs: 0,
+        has_active_movement=lambda _db, **_kwargs: False,
         is_cooperation_inbound=lambda **_kwargs: False,
         ensure_cooperation_receive_limit=lambda **_kwargs: None,
         now_utc=lambda: datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc),
@@ -82,7 +82,7 @@ def test_stage_link_mismatch_fails() -> None:
 def test_single_active_movement_per_part_enforced() -> None:
     with pytest.raises(ValueError, match="active movement"):
         ensure_single_active_movement(
-            existing_active_count=1,
+            has_other_active=True,
             current_status="received",
             next_status="sent",
             allow_parallel=False,
@@ -95,11 +95,12 @@ def _hooks(*, part, movement=None, can_access=True, now=None) -> MovementUseCase
 
     return MovementUseCaseHooks(
         resolve_org_entity=_resolver(part, movement),
+        resolve_movement_with_part=lambda _db, **_kwargs: (movement, part),
         can_access_part=lambda _db, _part, _user: can_access,
         recompute_part_state=lambda _db, part: None,
         get_stage_status_in_org=lambda _db, stage_id, org_id: SimpleNamespace(id=stage_id, part_id=part.id),  # noqa: ARG005
         ensure_stage_movement_allowed=lambda **_kwargs: None,
-        count_active_movements=lambda _db, **_kwargs: 0,
+        has_active_movement=lambda _db, **_kwargs: False,
         is_cooperation_inbound=lambda **_kwargs: False,
         ensure_cooperation_receive_limit=lambda **_kwargs: None,
         now_utc=lambda: fixed_now,
@@ -192,6 +193,7 @@ def test_update_movement_happy_path_to_received_sets_qty_received_and_audits() -
     assert result["status"] == "received"
     assert movement.status == "received"
     assert movement.qty_received == 7
+    assert db.flush_calls == 1
     assert db.commit_calls == 1
     audits = [item for item in db.added if isinstance(item, AuditEvent)]
     assert len(audits) == 1
@@ -6,9 +6,9 @@ import pytest
 
 from app.routers import movements as movements_router
 from app.routers.movements import (
-    _apply_cooperation_location_fallback,
-    _apply_cooperation_partial_location,
+    LocationInfo,
     _movement_affects_location,
+    _resolve_location,
     _resolve_eta,
     _to_movement_out_safe,
 )
@@ -30,38 +30,34 @@ def test_sent_with_sent_at_affects_location() -> None:
 
 
 def test_cooperation_fallback_location_and_holder_without_movements() -> None:
-    part = SimpleNamespace(is_cooperation=True, cooperation_partner="ПК Реном")
-    current_location, current_holder = _apply_cooperation_location_fallback(
-        part=part,
-        current_location=None,
-        current_holder=None,
+    part = SimpleNamespace(is_cooperation=True, cooperation_partner="ПК Реном", qty_plan=10)
+    location_info = _resolve_location(part, None)
+    assert location_info == LocationInfo(location="У кооператора", holder="ПК Реном")
+
+
+def _received_in_shop() -> SimpleNamespace:
+    return SimpleNamespace(
+        status="received",
+        from_location="Кооператор",
+        from_holder=None,
+        to_location="Цех",
+        to_holder="Производство",
+        carrier=None,
     )
-    assert current_location == "У кооператора"
-    assert current_holder == "ПК Реном"
 
 
 def test_cooperation_partial_location_for_mixed_holder_state() -> None:
-    part = SimpleNamespace(is_cooperation=True, qty_plan=18196)
-    current_location, current_holder = _apply_cooperation_partial_location(
-        part=part,
-        current_location="Цех",
-        current_holder="Производство",
-        received_qty=5000,
-    )
-    assert current_location == "Кооператор + Цех"
-    assert current_holder == "В цехе 5000 из 18196 шт"
+    part = SimpleNamespace(is_cooperation=True, qty_plan=18196, cooperation_partner=None)
+    location_info = _resolve_location(part, _received_in_shop(), received_qty=5000)
+    assert location_info.location == "Кооператор + Цех"
+    assert location_info.holder == "В цехе 5000 из 18196 шт"
 
 
 def test_cooperation_partial_location_does_not_override_when_fully_received() -> None:
-    part = SimpleNamespace(is_cooperation=True, qty_plan=18196)
-    current_location, current_holder = _apply_cooperation_partial_location(
-        part=part,
-        current_location="Цех",
-        current_holder="Производство",
-        received_qty=18196,
-    )
-    assert current_location == "Цех"
-    assert current_holder == "Производство"
+    part = SimpleNamespace(is_cooperation=True, qty_plan=18196, cooperation_partner=None)
+    location_info = _resolve_location(part, _received_in_shop(), received_qty=18196)
+    assert location_info.location == "Цех"
+    assert location_info.holder == "Производство"
 
 
 def test_cooperation_eta_fallback_from_part_due_date() -> None:
@@ -113,6 +109,7 @@ def test_to_movement_out_safe_falls_back_when_timestamps_missing() -> None:
     response = _to_movement_out_safe(movement)
 
     assert response.id == movement.id
+    assert response.date == movement.date
     assert response.created_at is not None
     assert response.updated_at is not None
 
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services import part_read_cache
+
+
+class _RedisStub:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class _BrokenRedis:
+    def get(self, _key: str) -> str | None:
+        raise RedisConnectionError("down")
+
+    def set(self, *_args, **_kwargs) -> None:
+        raise RedisConnectionError("down")
+
+    def delete(self, *_keys: str) -> None:
+        raise RedisConnectionError("down")
+
+
+def test_invalidate_drops_movements_and_journey_for_part(monkeypatch) -> None:
+    stub = _RedisStub()
+    monkeypatch.setattr(part_read_cache, "_redis_client", stub)
+    monkeypatch.setattr(part_read_cache.settings, "PART_READ_CACHE_TTL_SECONDS", 30)
+    org_id, part_id, other_part_id = uuid4(), uuid4(), uuid4()
+
+    part_read_cache.store_part_read("movements", org_id=org_id, part_id=part_id, payload="[]")
+    part_read_cache.store_part_read("journey", org_id=org_id, part_id=part_id, payload="{}")
+    part_read_cache.store_part_read("journey", org_id=org_id, part_id=other_part_id, payload="{}")
+
+    part_read_cache.invalidate_part_read_cache(org_id, part_id)
+
+    assert part_read_cache.get_cached_part_read("movements", org_id=org_id, part_id=part_id) is None
+    assert part_read_cache.get_cached_part_read("journey", org_id=org_id, part_id=part_id) is None
+    assert part_read_cache.get_cached_part_read("journey", org_id=org_id, part_id=other_part_id) == "{}"
+
+
+def test_redis_errors_fail_open(monkeypatch) -> None:
+    monkeypatch.setattr(part_read_cache, "_redis_client", _BrokenRedis())
+    monkeypatch.setattr(part_read_cache.settings, "PART_READ_CACHE_TTL_SECONDS", 30)
+    org_id, part_id = uuid4(), uuid4()
+
+    part_read_cache.store_part_read("journey", org_id=org_id, part_id=part_id, payload="{}")
+    part_read_cache.invalidate_part_read_cache(org_id, part_id)
+
+    assert part_read_cache.get_cached_part_read("journey", org_id=org_id, part_id=part_id) is None
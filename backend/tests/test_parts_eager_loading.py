@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import LogisticsEntry, Machine, MachineNorm, Part, PartStageStatus, StageFact
+from app.routers import parts as parts_router
+
+
+# Postgres-only column types, rendered for the in-memory SQLite schema used here.
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(_type, _compiler, **_kwargs) -> str:
+    return "CHAR(32)"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(_type, _compiler, **_kwargs) -> str:
+    return "JSON"
+
+
+@pytest.fixture
+def seeded_db(monkeypatch):
+    # Part reads run with raiseload("*"): any relationship the routers don't eager-load fails here.
+    monkeypatch.setattr(parts_router.settings, "SQL_RAISELOAD", True)
+
+    engine = create_engine("sqlite://")
+    tables = [model.__table__ for model in (Machine, Part, PartStageStatus, StageFact, LogisticsEntry, MachineNorm)]
+    Base.metadata.create_all(engine, tables=tables)
+    db = sessionmaker(bind=engine, autoflush=False)()
+
+    org_id = uuid4()
+    machine = Machine(id=uuid4(), org_id=org_id, name="M-1", department="machining")
+    db.add(machine)
+    for idx in range(3):
+        part = Part(
+            id=uuid4(),
+            org_id=org_id,
+            code=f"P-{idx}",
+            name=f"Part {idx}",
+            qty_plan=10,
+            deadline=date(2026, 3, 1 + idx),
+            machine_id=machine.id,
+            required_stages=["machining", "fitting", "qc"],
+        )
+        db.add(part)
+        db.add_all(PartStageStatus(part_id=part.id, stage=stage) for stage in part.required_stages)
+        db.add(
+            StageFact(
+                org_id=org_id,
+                part_id=part.id,
+                stage="machining",
+                date=date(2026, 2, 20),
+                shift_type="day",
+                machine_id=machine.id,
+                operator_id=uuid4(),
+                qty_good=4,
+                qty_scrap=1,
+            )
+        )
+    db.commit()
+
+    yield db, SimpleNamespace(id=uuid4(), org_id=org_id, role="admin", initials="ADM")
+    db.close()
+
+
+def test_get_parts_builds_page_without_lazy_loads(seeded_db) -> None:
+    db, user = seeded_db
+
+    response = parts_router.get_parts(limit=20, offset=0, current_user=user, db=db)
+    payload = json.loads(response.body)
+
+    assert payload["total"] == 3
+    assert [item["code"] for item in payload["items"]] == ["P-0", "P-1", "P-2"]
+    assert all(item["machine"]["name"] == "M-1" for item in payload["items"])
+    assert all(len(item["stage_statuses"]) == 3 for item in payload["items"])
+    assert all(item["progress"]["qty_scrap"] == 1 for item in payload["items"])
+
+
+def test_get_part_builds_detail_without_lazy_loads(seeded_db) -> None:
+    db, user = seeded_db
+    part_id = db.query(Part.id).filter(Part.code == "P-1").scalar()
+    db.expunge_all()
+
+    response = parts_router.get_part(part_id=part_id, current_user=user, db=db)
+
+    assert response.machine.name == "M-1"
+    assert response.forecast is not None
+
+
+def test_part_read_options_refuse_lazy_loads(seeded_db) -> None:
+    db, _user = seeded_db
+    db.expunge_all()
+
+    part = db.query(Part).options(*parts_router._part_read_options()).first()
+
+    with pytest.raises(InvalidRequestError):
+        part.spec_items
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
 from uuid import uuid4
@@ -16,6 +17,9 @@ class _QueryStub:
     def filter(self, *_args, **_kwargs):
         return self
 
+    def options(self, *_args, **_kwargs):
+        return self
+
     def count(self) -> int:
         return len(self._rows)
 
@@ -83,21 +87,23 @@ def test_get_parts_returns_items_with_total_limit_offset(monkeypatch) -> None:
     db = _SessionStub(rows)
 
     monkeypatch.setattr(parts_router, "apply_part_visibility_scope", lambda query, _db, _user: query)
+    monkeypatch.setattr(parts_router, "_prefetch_page_progress", lambda _db, _parts: {})
     monkeypatch.setattr(
         parts_router,
         "calculate_part_progress",
-        lambda _db, _part: (
+        lambda _db, _part, **_kwargs: (
             {"overall_percent": 0, "overall_qty_done": 0, "qty_scrap": 0, "bottleneck_stage": None},
             [],
         ),
     )
 
     response = parts_router.get_parts(limit=2, offset=1, current_user=_user(), db=db)
+    payload = json.loads(response.body)
 
-    assert response.total == 3
-    assert response.limit == 2
-    assert response.offset == 1
-    assert [item.code for item in response.items] == ["P-2", "P-3"]
+    assert payload["total"] == 3
+    assert payload["limit"] == 2
+    assert payload["offset"] == 1
+    assert [item["code"] for item in payload["items"]] == ["P-2", "P-3"]
 
 
 def test_get_parts_keeps_total_when_page_is_empty(monkeypatch) -> None:
@@ -105,16 +111,18 @@ def test_get_parts_keeps_total_when_page_is_empty(monkeypatch) -> None:
     db = _SessionStub(rows)
 
     monkeypatch.setattr(parts_router, "apply_part_visibility_scope", lambda query, _db, _user: query)
+    monkeypatch.setattr(parts_router, "_prefetch_page_progress", lambda _db, _parts: {})
     monkeypatch.setattr(
         parts_router,
         "calculate_part_progress",
-        lambda _db, _part: (
+        lambda _db, _part, **_kwargs: (
             {"overall_percent": 0, "overall_qty_done": 0, "qty_scrap": 0, "bottleneck_stage": None},
             [],
         ),
     )
 
     response = parts_router.get_parts(limit=20, offset=100, current_user=_user(), db=db)
+    payload = json.loads(response.body)
 
-    assert response.total == 2
-    assert response.items == []
+    assert payload["total"] == 2
+    assert payload["items"] == []
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models import PartStageStatus, StageFact, User
+from app.routers import facts as facts_router
+from app.schemas import StageFactCreate
+from app.services.part_state import StageTotals
+
+
+class _QueryStub:
+    def __init__(self, rows: list[object]) -> None:
+        self._rows = rows
+
+    def filter(self, *_args, **_kwargs):
+        return self
+
+    def order_by(self, *_args, **_kwargs):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class _SessionStub:
+    """Keeps pending and flushed objects apart, like a session with autoflush disabled."""
+
+    def __init__(self, stage_statuses: list[object]) -> None:
+        self._stage_statuses = stage_statuses
+        self.pending: list[object] = []
+        self.flushed: list[object] = []
+
+    def add(self, obj) -> None:
+        self.pending.append(obj)
+
+    def add_all(self, objs) -> None:
+        self.pending.extend(objs)
+
+    def flush(self) -> None:
+        self.flushed.extend(self.pending)
+        self.pending = []
+
+    def commit(self) -> None:
+        self.flush()
+
+    def refresh(self, _obj) -> None:
+        return None
+
+    def query(self, entity):
+        if entity is PartStageStatus:
+            return _QueryStub(self._stage_statuses)
+        if entity is StageFact.operator_id:
+            return _QueryStub(
+                [(obj.operator_id,) for obj in self.flushed if isinstance(obj, StageFact) and obj.operator_id]
+            )
+        if entity is User:
+            return _QueryStub([])
+        raise AssertionError(f"Unexpected query: {entity}")
+
+
+def test_first_fact_sets_stage_operator(monkeypatch) -> None:
+    org_id = uuid4()
+    operator_id = uuid4()
+    part = SimpleNamespace(
+        id=uuid4(),
+        org_id=org_id,
+        code="P-1",
+        qty_plan=10,
+        qty_done=0,
+        status="not_started",
+        is_cooperation=False,
+        machine_id=uuid4(),
+        required_stages=["machining", "fitting", "qc"],
+    )
+    fitting_status = SimpleNamespace(
+        stage="fitting", status="pending", started_at=None, completed_at=None, operator_id=None
+    )
+    db = _SessionStub([fitting_status])
+    user = SimpleNamespace(id=uuid4(), org_id=org_id, role="master", initials="USR")
+
+    monkeypatch.setattr(facts_router, "require_org_entity", lambda *_args, **_kwargs: part)
+    monkeypatch.setattr(facts_router, "can_access_part", lambda *_args: True)
+    monkeypatch.setattr(facts_router, "_ensure_stage_prerequisites", lambda *_args: None)
+    monkeypatch.setattr(
+        facts_router,
+        "compute_stage_totals",
+        lambda _db, *, part: {"machining": StageTotals(good=10, facts_count=1)},
+    )
+    monkeypatch.setattr(facts_router, "invalidate_part_read_cache", lambda *_args: None)
+    monkeypatch.setattr(facts_router, "_fact_to_response", lambda fact, _operator: fact)
+
+    facts_router.create_stage_fact(
+        part_id=part.id,
+        data=StageFactCreate(stage="fitting", date=date(2026, 2, 20), operator_id=operator_id, qty_good=4),
+        current_user=user,
+        db=db,
+    )
+
+    assert fitting_status.status == "in_progress"
+    assert fitting_status.operator_id == operator_id
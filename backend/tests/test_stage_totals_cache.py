@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services import part_state
+
+
+def test_cached_stage_totals_reuses_result_until_session_flush(monkeypatch) -> None:
+    calls: list[object] = []
+
+    def _compute(_db, *, part):
+        calls.append(part.id)
+        return {"machining": part_state.StageTotals(good=3)}
+
+    monkeypatch.setattr(part_state, "compute_stage_totals", _compute)
+    db = SimpleNamespace(info={})
+    part = SimpleNamespace(id=uuid4())
+
+    first = part_state.cached_stage_totals(db, part=part)
+    second = part_state.cached_stage_totals(db, part=part)
+    assert first is second
+    assert len(calls) == 1
+
+    part_state._drop_cached_stage_totals(db, None)
+    part_state.cached_stage_totals(db, part=part)
+    assert len(calls) == 2
+
+
+def test_with_added_fact_advances_stage_timestamps() -> None:
+    part = SimpleNamespace(is_cooperation=False)
+    first, second = datetime(2026, 2, 20, 8, tzinfo=timezone.utc), datetime(2026, 2, 21, 8, tzinfo=timezone.utc)
+
+    totals = part_state.with_added_fact({}, part=part, stage="machining", qty_good=4, qty_scrap=0, created_at=first)
+    totals = part_state.with_added_fact(totals, part=part, stage="machining", qty_good=6, qty_scrap=1, created_at=second)
+
+    machining = totals["machining"]
+    assert (machining.good, machining.scrap, machining.facts_count) == (10, 1, 2)
+    assert (machining.first_at, machining.last_at) == (first, second)